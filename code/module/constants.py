@@ -1,5 +1,8 @@
 """constants n shit"""
 
+from typing import ClassVar
+
+import numpy as np
 import pandas as pd
 
 
@@ -157,6 +160,10 @@ class Taches:
         Durée des tâches d'arrivée (en minutes).
     T_DEP : dict[int, int]
         Durée des tâches de départ (en minutes).
+    DUREES_ARR : np.ndarray
+        Durée des tâches d'arrivée (en minutes), indexée par numéro de tâche.
+    DUREES_DEP : np.ndarray
+        Durée des tâches de départ (en minutes), indexée par numéro de tâche.
     """
 
     # définition des taches
@@ -172,3 +179,14 @@ class Taches:
 
     # Durée des tâches sur les trains de départ
     T_DEP = {1: 15, 2: 150, 3: 15, 4: 20}
+
+    # Mêmes durées en tableaux, pour les calculs vectorisés
+    DUREES_ARR: ClassVar[np.ndarray] = np.bincount(
+        list(T_ARR), weights=list(T_ARR.values())
+    ).astype(np.int64)
+    DUREES_ARR.flags.writeable = False
+
+    DUREES_DEP: ClassVar[np.ndarray] = np.bincount(
+        list(T_DEP), weights=list(T_DEP.values())
+    ).astype(np.int64)
+    DUREES_DEP.flags.writeable = False
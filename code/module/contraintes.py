@@ -509,35 +509,43 @@ def contraintes_machines(
           au départ sur les machines.
     """
 
-    M_big = 100000  # Une grande constante, à ajuster en fonction de tes données
+    # Disjonctions par contraintes indicatrices : pas de grand M, que Gurobi
+    # exploite directement en prétraitement.
+    # Une seule variable par paire non ordonnée de trains (i < j) : la
+    # disjonction couvre déjà les deux ordres de passage
+    ids_arr = tuple(liste_id_train_arrivee)
+    ids_dep = tuple(liste_id_train_depart)
+
     delta_arr = {}
 
     for m_arr in Taches.TACHES_ARR_MACHINE:
-        for id_arr_1 in tqdm(
-            liste_id_train_arrivee,
-            "Contrainte assurant qu'il n'y a qu'un train niveau de la machine DEB",
+        for i, id_arr_1 in enumerate(
+            tqdm(
+                ids_arr,
+                "Contrainte assurant qu'il n'y a qu'un train niveau de la machine DEB",
+            )
         ):
-            for id_arr_2 in liste_id_train_arrivee:
-                if id_arr_1 != id_arr_2:
-                    delta_arr[(m_arr, id_arr_1, id_arr_2)] = model.addVar(
-                        vtype=grb.GRB.BINARY,
-                        name=f"delta_arr_{m_arr}_{id_arr_1}_{id_arr_2}",
-                    )
+            for id_arr_2 in ids_arr[i + 1 :]:
+                delta_arr[(m_arr, id_arr_1, id_arr_2)] = model.addVar(
+                    vtype=grb.GRB.BINARY,
+                    name=f"delta_arr_{m_arr}_{id_arr_1}_{id_arr_2}",
+                )
 
-                    # Si delta = 1, alors id_arr_2 se termine avant id_arr_1
-                    model.addConstr(
-                        15 * t_arr[(m_arr, id_arr_2)] + Taches.T_ARR[m_arr]
-                        <= 15 * t_arr[(m_arr, id_arr_1)]
-                        + (1 - delta_arr[(m_arr, id_arr_1, id_arr_2)]) * M_big
-                    )
+                # Si delta = 1, alors id_arr_2 se termine avant id_arr_1
+                model.addGenConstrIndicator(
+                    delta_arr[(m_arr, id_arr_1, id_arr_2)],
+                    True,
+                    15 * t_arr[(m_arr, id_arr_2)] + Taches.T_ARR[m_arr]
+                    <= 15 * t_arr[(m_arr, id_arr_1)],
+                )
 
-                    # Si delta = 0, alors id_arr_1 se termine avant id_arr_2
-                    model.addConstr(
-                        15 * t_arr[(m_arr, id_arr_2)]
-                        >= 15 * t_arr[(m_arr, id_arr_1)]
-                        + Taches.T_ARR[m_arr]
-                        - delta_arr[(m_arr, id_arr_1, id_arr_2)] * M_big
-                    )
+                # Si delta = 0, alors id_arr_1 se termine avant id_arr_2
+                model.addGenConstrIndicator(
+                    delta_arr[(m_arr, id_arr_1, id_arr_2)],
+                    False,
+                    15 * t_arr[(m_arr, id_arr_2)]
+                    >= 15 * t_arr[(m_arr, id_arr_1)] + Taches.T_ARR[m_arr],
+                )
 
     delta_dep = {}
 
@@ -545,32 +553,84 @@ def contraintes_machines(
         Taches.TACHES_DEP_MACHINE,
         "Contrainte assurant qu'il n'y a qu'un train niveau des machines FOR et DEG",
     ):
-        for id_dep_1 in liste_id_train_depart:
-            for id_dep_2 in liste_id_train_depart:
-                if id_dep_1 != id_dep_2:
-                    delta_dep[(m_dep, id_dep_1, id_dep_2)] = model.addVar(
-                        vtype=grb.GRB.BINARY,
-                        name=f"delta_dep_{m_dep}_{id_dep_1}_{id_dep_2}",
-                    )
+        for i, id_dep_1 in enumerate(ids_dep):
+            for id_dep_2 in ids_dep[i + 1 :]:
+                delta_dep[(m_dep, id_dep_1, id_dep_2)] = model.addVar(
+                    vtype=grb.GRB.BINARY,
+                    name=f"delta_dep_{m_dep}_{id_dep_1}_{id_dep_2}",
+                )
 
-                    # Si delta = 1, alors id_dep_2 se termine avant id_dep_1
-                    model.addConstr(
-                        15 * t_dep[(m_dep, id_dep_2)] + Taches.T_DEP[m_dep]
-                        <= 15 * t_dep[(m_dep, id_dep_1)]
-                        + (1 - delta_dep[(m_dep, id_dep_1, id_dep_2)]) * M_big
-                    )
+                # Si delta = 1, alors id_dep_2 se termine avant id_dep_1
+                model.addGenConstrIndicator(
+                    delta_dep[(m_dep, id_dep_1, id_dep_2)],
+                    True,
+                    15 * t_dep[(m_dep, id_dep_2)] + Taches.T_DEP[m_dep]
+                    <= 15 * t_dep[(m_dep, id_dep_1)],
+                )
 
-                    # Si delta = 0, alors id_dep_1 se termine avant id_dep_2
-                    model.addConstr(
-                        15 * t_dep[(m_dep, id_dep_2)]
-                        >= 15 * t_dep[(m_dep, id_dep_1)]
-                        + Taches.T_DEP[m_dep]
-                        - delta_dep[(m_dep, id_dep_1, id_dep_2)] * M_big
-                    )
+                # Si delta = 0, alors id_dep_1 se termine avant id_dep_2
+                model.addGenConstrIndicator(
+                    delta_dep[(m_dep, id_dep_1, id_dep_2)],
+                    False,
+                    15 * t_dep[(m_dep, id_dep_2)]
+                    >= 15 * t_dep[(m_dep, id_dep_1)] + Taches.T_DEP[m_dep],
+                )
 
     return delta_arr, delta_dep
 
 
+def _respect_fenetres(
+    model: grb.Model, debut, duree: int, limites: list, nom: str
+) -> grb.tupledict:
+    """
+    Impose qu'une tâche se déroule entièrement dans une plage d'ouverture.
+
+    Les limites alternent fin d'ouverture et début d'ouverture. Chaque cas
+    (avant la première limite, entre deux limites, après la dernière) est
+    activé par une variable binaire via des contraintes indicatrices, sans
+    grand M, et exactement un cas doit être vrai.
+
+    Paramètres
+    ----------
+    model : grb.Model
+        Modèle d'optimisation Gurobi.
+    debut : grb.Var
+        Variable de début de la tâche (en créneaux de 15 minutes).
+    duree : int
+        Durée de la tâche (en minutes).
+    limites : list
+        Limites des plages horaires d'ouverture (en minutes).
+    nom : str
+        Nom des variables binaires créées.
+
+    Retourne
+    -------
+    grb.tupledict
+        Variables binaires indiquant le cas retenu.
+    """
+    n = len(limites)
+    delta = model.addVars(n // 2 + 1, vtype=grb.GRB.BINARY, name=nom)
+
+    # Premier cas : Avant la première limite
+    model.addGenConstrIndicator(delta[0], True, 15 * debut <= limites[0] - duree)
+
+    # Cas intermédiaires : Entre Limites
+    for i in range(1, n // 2):
+        model.addGenConstrIndicator(delta[i], True, 15 * debut >= limites[2 * i - 1])
+        model.addGenConstrIndicator(
+            delta[i], True, 15 * debut <= limites[2 * i] - duree
+        )
+
+    # Dernier cas : Après la dernière limite
+    if n % 2 == 0:
+        model.addGenConstrIndicator(delta[n // 2], True, 15 * debut >= limites[-1])
+
+    # Une seule condition peut être vraie (avant, entre ou après les limites)
+    model.addConstr(grb.quicksum(delta.values()) == 1)
+
+    return delta
+
+
 def contraintes_ouvertures_machines(
     model: grb.Model,
     t_arr: dict,
@@ -608,8 +668,6 @@ def contraintes_ouvertures_machines(
         - `delta_lim_machine_DEG` : Variables binaires pour le respect des horaires
           des machines de type DEG.
     """
-    M_big = 10000000  # Une grande constante pour relacher certaines contraintes
-
     N_machines = {key: len(Limites_machines[key]) for key in Limites_machines.keys()}
 
     delta_lim_machine_DEB = {}
@@ -618,51 +676,12 @@ def contraintes_ouvertures_machines(
         for id_arr in tqdm(
             liste_id_train_arrivee, "Contrainte de fermeture de la machine DEB"
         ):
-            delta_lim_machine_DEB[id_arr] = model.addVars(
-                N_machines[Machines.DEB] // 2 + 1,
-                vtype=grb.GRB.BINARY,
-                name=f"delta_machine_DEB_{id_arr}",
-            )  # N//2 + 1  contraintes
-            # Premier cas : Avant la première limite
-            model.addConstr(
-                15 * t_arr[(3, id_arr)]
-                <= Limites_machines[Machines.DEB][0]
-                - Taches.T_ARR[3]
-                + (1 - delta_lim_machine_DEB[id_arr][0]) * M_big
-            )
-
-            # Cas intermédiaires : Entre Limites
-            for i in range(1, N_machines[Machines.DEB] // 2):
-                model.addConstr(
-                    15 * t_arr[(3, id_arr)]
-                    >= Limites_machines[Machines.DEB][2 * i - 1]
-                    - (1 - delta_lim_machine_DEB[id_arr][i]) * M_big
-                )
-                model.addConstr(
-                    15 * t_arr[(3, id_arr)]
-                    <= Limites_machines[Machines.DEB][2 * i]
-                    - Taches.T_ARR[3]
-                    + (1 - delta_lim_machine_DEB[id_arr][i]) * M_big
-                )
-
-            # Dernier cas : Après la dernière limite (
-            if N_machines[Machines.DEB] % 2 == 0:
-                model.addConstr(
-                    15 * t_arr[(3, id_arr)]
-                    >= Limites_machines[Machines.DEB][-1]
-                    - (1 - delta_lim_machine_DEB[id_arr][N_machines[Machines.DEB] // 2])
-                    * M_big
-                )
-
-            # Une seule condition peut être vraie (avant, entre ou après les limites)
-            model.addConstr(
-                grb.quicksum(
-                    [
-                        delta_lim_machine_DEB[id_arr][i]
-                        for i in range(N_machines[Machines.DEB] // 2 + 1)
-                    ]
-                )
-                == 1
+            delta_lim_machine_DEB[id_arr] = _respect_fenetres(
+                model,
+                t_arr[(3, id_arr)],
+                Taches.T_ARR[3],
+                Limites_machines[Machines.DEB],
+                f"delta_machine_DEB_{id_arr}",
             )
 
     delta_lim_machine_FOR = {}
@@ -671,52 +690,12 @@ def contraintes_ouvertures_machines(
         for id_dep in tqdm(
             liste_id_train_depart, "Contrainte de fermeture de la machine FOR"
         ):
-            delta_lim_machine_FOR[id_dep] = model.addVars(
-                N_machines[Machines.FOR] // 2 + 1,
-                vtype=grb.GRB.BINARY,
-                name=f"delta_machine_dep_1_{id_dep}",
-            )
-
-            # Premier cas : Avant la première limite
-            model.addConstr(
-                15 * t_dep[(1, id_dep)]
-                <= Limites_machines[Machines.FOR][0]
-                - Taches.T_DEP[1]
-                + (1 - delta_lim_machine_FOR[id_dep][0]) * M_big
-            )
-
-            # Cas intermédiaires
-            for i in range(1, N_machines[Machines.FOR] // 2):
-                model.addConstr(
-                    15 * t_dep[(1, id_dep)]
-                    >= Limites_machines[Machines.FOR][2 * i - 1]
-                    - (1 - delta_lim_machine_FOR[id_dep][i]) * M_big
-                )  # Limite inf
-                model.addConstr(
-                    15 * t_dep[(1, id_dep)]
-                    <= Limites_machines[Machines.FOR][2 * i]
-                    - Taches.T_DEP[1]
-                    + (1 - delta_lim_machine_FOR[id_dep][i]) * M_big
-                )  # Limite sup
-
-            # Dernier cas : Après la dernière limite
-            if N_machines[Machines.FOR] % 2 == 0:
-                model.addConstr(
-                    15 * t_dep[(1, id_dep)]
-                    >= Limites_machines[Machines.FOR][-1]
-                    - (1 - delta_lim_machine_FOR[id_dep][N_machines[Machines.FOR] // 2])
-                    * M_big
-                )
-
-            # Une seule de ces conditions peut être vraie
-            model.addConstr(
-                grb.quicksum(
-                    [
-                        delta_lim_machine_FOR[id_dep][i]
-                        for i in range(N_machines[Machines.FOR] // 2 + 1)
-                    ]
-                )
-                == 1
+            delta_lim_machine_FOR[id_dep] = _respect_fenetres(
+                model,
+                t_dep[(1, id_dep)],
+                Taches.T_DEP[1],
+                Limites_machines[Machines.FOR],
+                f"delta_machine_dep_1_{id_dep}",
             )
 
     delta_lim_machine_DEG = {}
@@ -725,52 +704,12 @@ def contraintes_ouvertures_machines(
         for id_dep in tqdm(
             liste_id_train_depart, "Contrainte de fermeture de la machine DEG"
         ):
-            delta_lim_machine_DEG[id_dep] = model.addVars(
-                N_machines[Machines.DEG] // 2 + 1,
-                vtype=grb.GRB.BINARY,
-                name=f"delta_machine_dep_3_{id_dep}",
-            )
-
-            # Premier cas : Avant la première limite
-            model.addConstr(
-                15 * t_dep[(3, id_dep)]
-                <= Limites_machines[Machines.DEG][0]
-                - Taches.T_DEP[3]
-                + (1 - delta_lim_machine_DEG[id_dep][0]) * M_big
-            )
-
-            # Cas intermédiaires : Entre Limites
-            for i in range(1, N_machines[Machines.DEG] // 2):
-                model.addConstr(
-                    15 * t_dep[(3, id_dep)]
-                    >= Limites_machines[Machines.DEG][2 * i - 1]
-                    - (1 - delta_lim_machine_DEG[id_dep][i]) * M_big
-                )  # Limite inf
-                model.addConstr(
-                    15 * t_dep[(3, id_dep)]
-                    <= Limites_machines[Machines.DEG][2 * i]
-                    - Taches.T_DEP[3]
-                    + (1 - delta_lim_machine_DEG[id_dep][i]) * M_big
-                )  # Limite sup
-
-            # Dernier cas : Après la dernière limite
-            if N_machines[Machines.DEG] % 2 == 0:
-                model.addConstr(
-                    15 * t_dep[(3, id_dep)]
-                    >= Limites_machines[Machines.DEG][-1]
-                    - (1 - delta_lim_machine_DEG[id_dep][N_machines[Machines.DEG] // 2])
-                    * M_big
-                )
-
-            # Une seule de ces conditions peut être vraie
-            model.addConstr(
-                grb.quicksum(
-                    [
-                        delta_lim_machine_DEG[id_dep][i]
-                        for i in range(N_machines[Machines.DEG] // 2 + 1)
-                    ]
-                )
-                == 1
+            delta_lim_machine_DEG[id_dep] = _respect_fenetres(
+                model,
+                t_dep[(3, id_dep)],
+                Taches.T_DEP[3],
+                Limites_machines[Machines.DEG],
+                f"delta_machine_dep_3_{id_dep}",
             )
     return (
         delta_lim_machine_DEB,
@@ -816,8 +755,6 @@ def contraintes_ouvertures_chantiers(
         - `delta_lim_chantier_dep` : Variables binaires indiquant si un train
           respecte les horaires du chantier de type DEP.
     """
-    M_big = 10000000  # Une grande constante pour relacher certaines contraintes
-
     N_chantiers = {key: len(Limites_chantiers[key]) for key in Limites_chantiers.keys()}
 
     delta_lim_chantier_rec = {1: {}, 2: {}, 3: {}}
@@ -830,57 +767,12 @@ def contraintes_ouvertures_chantiers(
                 min(delta_lim_chantier_rec.keys()),
                 max(delta_lim_chantier_rec.keys()) + 1,
             ):
-                delta_lim_chantier_rec[m][id_arr] = model.addVars(
-                    N_chantiers[Chantiers.REC] // 2 + 1,
-                    vtype=grb.GRB.BINARY,
-                    name=f"delta_REC_{m}_{id_arr}",
-                )  # N//2 + 1  contraintes
-
-                # Premier cas : Avant la première limite
-                model.addConstr(
-                    15 * t_arr[(m, id_arr)]
-                    <= Limites_chantiers[Chantiers.REC][0]
-                    - Taches.T_ARR[m]
-                    + (1 - delta_lim_chantier_rec[m][id_arr][0]) * M_big
-                )
-
-                # Cas intermédiaires : Entre Limites
-                for i in range(1, N_chantiers[Chantiers.REC] // 2):
-                    model.addConstr(
-                        15 * t_arr[(m, id_arr)]
-                        >= Limites_chantiers[Chantiers.REC][2 * i - 1]
-                        - (1 - delta_lim_chantier_rec[m][id_arr][i]) * M_big
-                    )  # Limite inférieure (700)
-                    model.addConstr(
-                        15 * t_arr[(m, id_arr)]
-                        <= Limites_chantiers[Chantiers.REC][2 * i]
-                        - Taches.T_ARR[m]
-                        + (1 - delta_lim_chantier_rec[m][id_arr][i]) * M_big
-                    )  # Limite supérieure (1500)
-
-                # Dernier cas : Après la dernière limite (
-                if N_chantiers[Chantiers.REC] % 2 == 0:
-                    model.addConstr(
-                        15 * t_arr[(m, id_arr)]
-                        >= Limites_chantiers[Chantiers.REC][-1]
-                        - (
-                            1
-                            - delta_lim_chantier_rec[m][id_arr][
-                                N_chantiers[Chantiers.REC] // 2
-                            ]
-                        )
-                        * M_big
-                    )
-
-                # Une seule condition peut être vraie (avant, entre ou après les limites)
-                model.addConstr(
-                    grb.quicksum(
-                        [
-                            delta_lim_chantier_rec[m][id_arr][i]
-                            for i in range(N_chantiers[Chantiers.REC] // 2 + 1)
-                        ]
-                    )
-                    == 1
+                delta_lim_chantier_rec[m][id_arr] = _respect_fenetres(
+                    model,
+                    t_arr[(m, id_arr)],
+                    Taches.T_ARR[m],
+                    Limites_chantiers[Chantiers.REC],
+                    f"delta_REC_{m}_{id_arr}",
                 )
 
     delta_lim_chantier_for = {1: {}, 2: {}, 3: {}}
@@ -893,57 +785,12 @@ def contraintes_ouvertures_chantiers(
                 min(delta_lim_chantier_for.keys()),
                 max(delta_lim_chantier_for.keys()) + 1,
             ):
-                delta_lim_chantier_for[m][id_dep] = model.addVars(
-                    N_chantiers[Chantiers.FOR] // 2 + 1,
-                    vtype=grb.GRB.BINARY,
-                    name=f"delta_FOR_{m}_{id_dep}",
-                )  # N//2 + 1  contraintes
-
-                # Premier cas : Avant la première limite
-                model.addConstr(
-                    15 * t_dep[(m, id_dep)]
-                    <= Limites_chantiers[Chantiers.FOR][0]
-                    - Taches.T_DEP[m]
-                    + (1 - delta_lim_chantier_for[m][id_dep][0]) * M_big
-                )
-
-                # Cas intermédiaires : Entre Limites
-                for i in range(1, N_chantiers[Chantiers.FOR] // 2):
-                    model.addConstr(
-                        15 * t_dep[(m, id_dep)]
-                        >= Limites_chantiers[Chantiers.FOR][2 * i - 1]
-                        - (1 - delta_lim_chantier_for[m][id_dep][i]) * M_big
-                    )  # Limite inférieure (700)
-                    model.addConstr(
-                        15 * t_dep[(m, id_dep)]
-                        <= Limites_chantiers[Chantiers.FOR][2 * i]
-                        - Taches.T_DEP[m]
-                        + (1 - delta_lim_chantier_for[m][id_dep][i]) * M_big
-                    )  # Limite supérieure (1500)
-
-                # Dernier cas : Après la dernière limite (
-                if N_chantiers[Chantiers.FOR] % 2 == 0:
-                    model.addConstr(
-                        15 * t_dep[(m, id_dep)]
-                        >= Limites_chantiers[Chantiers.FOR][-1]
-                        - (
-                            1
-                            - delta_lim_chantier_for[m][id_dep][
-                                N_chantiers[Chantiers.FOR] // 2
-                            ]
-                        )
-                        * M_big
-                    )
-
-                # Une seule condition peut être vraie (avant, entre ou après les limites)
-                model.addConstr(
-                    grb.quicksum(
-                        [
-                            delta_lim_chantier_for[m][id_dep][i]
-                            for i in range(N_chantiers[Chantiers.FOR] // 2 + 1)
-                        ]
-                    )
-                    == 1
+                delta_lim_chantier_for[m][id_dep] = _respect_fenetres(
+                    model,
+                    t_dep[(m, id_dep)],
+                    Taches.T_DEP[m],
+                    Limites_chantiers[Chantiers.FOR],
+                    f"delta_FOR_{m}_{id_dep}",
                 )
 
     delta_lim_chantier_dep = {4: {}}
@@ -956,57 +803,12 @@ def contraintes_ouvertures_chantiers(
                 min(delta_lim_chantier_dep.keys()),
                 max(delta_lim_chantier_dep.keys()) + 1,
             ):
-                delta_lim_chantier_dep[m][id_dep] = model.addVars(
-                    N_chantiers[Chantiers.DEP] // 2 + 1,
-                    vtype=grb.GRB.BINARY,
-                    name=f"delta_DEP_{m}_{id_dep}",
-                )  # N//2 + 1  contraintes
-
-                # Premier cas : Avant la première limite
-                model.addConstr(
-                    15 * t_dep[(m, id_dep)]
-                    <= Limites_chantiers[Chantiers.DEP][0]
-                    - Taches.T_DEP[m]
-                    + (1 - delta_lim_chantier_dep[m][id_dep][0]) * M_big
-                )
-
-                # Cas intermédiaires : Entre Limites
-                for i in range(1, N_chantiers[Chantiers.DEP] // 2):
-                    model.addConstr(
-                        15 * t_dep[(m, id_dep)]
-                        >= Limites_chantiers[Chantiers.DEP][2 * i - 1]
-                        - (1 - delta_lim_chantier_dep[m][id_dep][i]) * M_big
-                    )  # Limite inférieure (700)
-                    model.addConstr(
-                        15 * t_dep[(m, id_dep)]
-                        <= Limites_chantiers[Chantiers.DEP][2 * i]
-                        - Taches.T_DEP[m]
-                        + (1 - delta_lim_chantier_dep[m][id_dep][i]) * M_big
-                    )  # Limite supérieure (1500)
-
-                # Dernier cas : Après la dernière limite (
-                if N_chantiers[Chantiers.DEP] % 2 == 0:
-                    model.addConstr(
-                        15 * t_dep[(m, id_dep)]
-                        >= Limites_chantiers[Chantiers.DEP][-1]
-                        - (
-                            1
-                            - delta_lim_chantier_dep[m][id_dep][
-                                N_chantiers[Chantiers.DEP] // 2
-                            ]
-                        )
-                        * M_big
-                    )
-
-                # Une seule condition peut être vraie (avant, entre ou après les limites)
-                model.addConstr(
-                    grb.quicksum(
-                        [
-                            delta_lim_chantier_dep[m][id_dep][i]
-                            for i in range(N_chantiers[Chantiers.DEP] // 2 + 1)
-                        ]
-                    )
-                    == 1
+                delta_lim_chantier_dep[m][id_dep] = _respect_fenetres(
+                    model,
+                    t_dep[(m, id_dep)],
+                    Taches.T_DEP[m],
+                    Limites_chantiers[Chantiers.DEP],
+                    f"delta_DEP_{m}_{id_dep}",
                 )
 
     return (
@@ -1045,14 +847,23 @@ def contraintes_succession(
     bool
         Retourne toujours `True` après l'ajout des contraintes.
     """
-    for id_dep in tqdm(
-        liste_id_train_depart,
-        "Contrainte assurant la succession des tâches entre les chantiers de REC et FOR",
-    ):
-        for id_arr in dict_correspondances[id_dep]:
-            model.addConstr(
-                15 * t_dep[(1, id_dep)] >= 15 * t_arr[(3, id_arr)] + Taches.T_ARR[3]
+    # Liste des arcs (départ, arrivée) construite une seule fois
+    correspondances = [
+        (id_dep, id_arr)
+        for id_dep in liste_id_train_depart
+        for id_arr in dict_correspondances[id_dep]
+    ]
+
+    model.addConstrs(
+        (
+            15 * t_dep[(1, id_dep)] >= 15 * t_arr[(3, id_arr)] + Taches.T_ARR[3]
+            for id_dep, id_arr in tqdm(
+                correspondances,
+                "Contrainte assurant la succession des tâches entre les chantiers de REC et FOR",
             )
+        ),
+        name="succession",
+    )
     return True
 
 
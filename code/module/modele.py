@@ -21,14 +21,14 @@ variable_premier_wagon : Initialise les variables de temps du début de la premi
     de débranchement sur les trains d'arrivée contenant des wagons du train de départ.
 variable_agents : Initialise les variables représentant le nombre d'agents utilisés
     sur le cycle k du roulement r.
-variable_who : Initialise les variables binaires who_arr et who_dep représentant 
-    l'utilisation ou non d'un agent d'un roulement r d'un cycle k pour une tache 
-    réalisée m sur un train n à un instant t donné. 
+variable_who : Initialise les variables binaires who_arr et who_dep représentant
+    l'utilisation ou non d'un agent d'un roulement r d'un cycle k pour une tache
+    réalisée m sur un train n à un instant t donné.
 variable_decomp : Initialise les variables décomposant les variables de début des tâches pour les
     trains à l'arrivée et au départ en leur numéro de cycle et leur temps dans le cycle.
-init_objectif : Crée la variable à minimiser de la fonction object ainsi que ses contraintes 
+init_objectif : Crée la variable à minimiser de la fonction object ainsi que ses contraintes
     (minimisation du nombre maximal de voies sur le chantier de Formation).
-init_objectif2 : Crée la variable à minimiser de la fonction object ainsi que ses contraintes 
+init_objectif2 : Crée la variable à minimiser de la fonction object ainsi que ses contraintes
     (minimisation du nomnbre de journées de service).
 """
 
@@ -340,11 +340,12 @@ def variables_debut_tache_arrive(
     dict
         Variables de début des tâches d'arrivée, indexées par (tâche, train).
     """
-    t_arr = {
-        (m, id_train_arr): model.addVar(vtype=grb.GRB.INTEGER, name="t")
-        for m in Taches.TACHES_ARRIVEE
-        for id_train_arr in liste_id_train_arrivee
-    }
+    t_arr = model.addVars(
+        Taches.TACHES_ARRIVEE,
+        list(liste_id_train_arrivee),
+        vtype=grb.GRB.INTEGER,
+        name="t_arr",
+    )
     return t_arr
 
 
@@ -367,11 +368,12 @@ def variables_debut_tache_depart(
     dict
         Variables de début des tâches de départ, indexées par (tâche, train).
     """
-    t_dep = {
-        (m, id_train_dep): model.addVar(vtype=grb.GRB.INTEGER, name="t")
-        for m in Taches.TACHES_DEPART
-        for id_train_dep in liste_id_train_depart
-    }
+    t_dep = model.addVars(
+        Taches.TACHES_DEPART,
+        list(liste_id_train_depart),
+        vtype=grb.GRB.INTEGER,
+        name="t_dep",
+    )
     return t_dep
 
 
@@ -404,28 +406,26 @@ def variable_is_present(
         Variables de présence des trains sur les chantiers
         à un instant t, indexées par (chantier, train, temps).
     """
+    instants = range(temps_min, temps_max + 1)
     is_present = {
-        Chantiers.REC: {
-            (id_train, t): model.addVar(
-                vtype=grb.GRB.BINARY, name=f"is_present_REC_{id_train}_{t}"
-            )
-            for id_train in liste_id_train_arrivee
-            for t in range(temps_min, temps_max + 1)
-        },
-        Chantiers.FOR: {
-            (id_train, t): model.addVar(
-                vtype=grb.GRB.BINARY, name=f"is_present_FOR_{id_train}_{t}"
-            )
-            for id_train in liste_id_train_depart
-            for t in range(temps_min, temps_max + 1)
-        },
-        Chantiers.DEP: {
-            (id_train, t): model.addVar(
-                vtype=grb.GRB.BINARY, name=f"is_present_DEP_{id_train}_{t}"
-            )
-            for id_train in liste_id_train_depart
-            for t in range(temps_min, temps_max + 1)
-        },
+        Chantiers.REC: model.addVars(
+            list(liste_id_train_arrivee),
+            instants,
+            vtype=grb.GRB.BINARY,
+            name="is_present_REC",
+        ),
+        Chantiers.FOR: model.addVars(
+            list(liste_id_train_depart),
+            instants,
+            vtype=grb.GRB.BINARY,
+            name="is_present_FOR",
+        ),
+        Chantiers.DEP: model.addVars(
+            list(liste_id_train_depart),
+            instants,
+            vtype=grb.GRB.BINARY,
+            name="is_present_DEP",
+        ),
     }
     return is_present
 
@@ -451,27 +451,28 @@ def variable_premier_wagon(
         Variables de temps du début de la première tâche de débranchement sur les trains
         d'arrivée contenant des wagons du train de départ, indexées par identifiant de train de départ.
     """
-    premier_wagon = {
-        id_train: model.addVar(vtype=grb.GRB.INTEGER,
-                               name=f"premier_wagon_{id_train}")
-        for id_train in liste_id_train_depart
-    }
+    premier_wagon = model.addVars(
+        list(liste_id_train_depart), vtype=grb.GRB.INTEGER, name="premier_wagon"
+    )
     return premier_wagon
 
 
 def variable_agents(
     model, nombre_roulements, nb_cycles_agents, max_agents_sur_roulement
 ):
-    nombre_agents = {
-        (r, k): model.addVar(
-            vtype=grb.GRB.INTEGER,
-            lb=0,
-            ub=max_agents_sur_roulement[r],
-            name=f"Nombre_agents_roulement_{r}_cycle_{k}",
-        )
+    # Borne supérieure propre à chaque roulement
+    bornes = {
+        (r, k): max_agents_sur_roulement[r]
         for r in range(1, nombre_roulements + 1)
         for k in range(1, nb_cycles_agents[r] + 1)
     }
+    nombre_agents = model.addVars(
+        list(bornes),
+        vtype=grb.GRB.INTEGER,
+        lb=0,
+        ub=bornes,
+        name="Nombre_agents_roulement_cycle",
+    )
     return nombre_agents
 
 
@@ -484,7 +485,7 @@ def variable_who(
     h_deb: dict,
 ):
     """
-    Définit des variables binaires indiquant si un agent effectue une tâche 
+    Définit des variables binaires indiquant si un agent effectue une tâche
     d'arrivée ou de départ à un instant donné dans un modèle d'optimisation.
 
     Paramètres :
@@ -509,28 +510,30 @@ def variable_who(
         - Variables binaires pour les tâches de départ indexées par tâche, train, agent, cycle et temps.
     """
 
-    who_arr = {
-        (m, n, r, k, t): model.addVar(
-            vtype=grb.GRB.BINARY,
-            name=f"Bool_roulement_{r}_réalise_tâche_arr_{m}_au_cycle_{k}_au_temps_{t}",
-        )
-        for m in Taches.TACHES_ARRIVEE
-        for n in liste_id_train_arrivee
-        for r in equip[("arr", m)]
-        for k in range(1, nb_cycles_agents[r] + 1)
-        for t in range(h_deb[(r, k)] // 5, h_deb[(r, k)] // 5 + 8 * 12)
-    }
-    who_dep = {
-        (m, n, r, k, t): model.addVar(
-            vtype=grb.GRB.BINARY,
-            name=f"Bool_roulement_{r}_réalise_tâche_dep_{m}_au_cycle_{k}_au_temps_{t}",
-        )
-        for m in Taches.TACHES_DEPART
-        for n in liste_id_train_depart
-        for r in equip[("dep", m)]
-        for k in range(1, nb_cycles_agents[r] + 1)
-        for t in range(h_deb[(r, k)] // 5, h_deb[(r, k)] // 5 + 8 * 12)
-    }
+    who_arr = model.addVars(
+        [
+            (m, n, r, k, t)
+            for m in Taches.TACHES_ARRIVEE
+            for n in liste_id_train_arrivee
+            for r in equip[("arr", m)]
+            for k in range(1, nb_cycles_agents[r] + 1)
+            for t in range(h_deb[(r, k)] // 5, h_deb[(r, k)] // 5 + 8 * 12)
+        ],
+        vtype=grb.GRB.BINARY,
+        name="Bool_roulement_réalise_tâche_arr",
+    )
+    who_dep = model.addVars(
+        [
+            (m, n, r, k, t)
+            for m in Taches.TACHES_DEPART
+            for n in liste_id_train_depart
+            for r in equip[("dep", m)]
+            for k in range(1, nb_cycles_agents[r] + 1)
+            for t in range(h_deb[(r, k)] // 5, h_deb[(r, k)] // 5 + 8 * 12)
+        ],
+        vtype=grb.GRB.BINARY,
+        name="Bool_roulement_réalise_tâche_dep",
+    )
     return who_arr, who_dep
 
 
@@ -560,30 +563,36 @@ def variable_decomp(
         - Variables de numéro de cycle des débuts de tâches d'arrivée.
         - Variables de numéro de cycle des débuts de tâches de départ.
     """
-    hat_arr = {
-        (m, id_train_arr): model.addVar(
-            vtype=grb.GRB.INTEGER, lb=0, ub=8 * 4 - 1, name="t"
-        )
-        for m in Taches.TACHES_ARRIVEE
-        for id_train_arr in liste_id_train_arrivee
-    }
-    hat_dep = {
-        (m, id_train_arr): model.addVar(
-            vtype=grb.GRB.INTEGER, lb=0, ub=8 * 4 - 1, name="t"
-        )
-        for m in Taches.TACHES_DEPART
-        for id_train_arr in liste_id_train_depart
-    }
-    k_arr = {
-        (m, id_train_arr): model.addVar(vtype=grb.GRB.INTEGER, lb=0, name="t")
-        for m in Taches.TACHES_ARRIVEE
-        for id_train_arr in liste_id_train_arrivee
-    }
-    k_dep = {
-        (m, id_train_arr): model.addVar(vtype=grb.GRB.INTEGER, lb=0, name="t")
-        for m in Taches.TACHES_DEPART
-        for id_train_arr in liste_id_train_depart
-    }
+    hat_arr = model.addVars(
+        Taches.TACHES_ARRIVEE,
+        list(liste_id_train_arrivee),
+        vtype=grb.GRB.INTEGER,
+        lb=0,
+        ub=8 * 4 - 1,
+        name="hat_arr",
+    )
+    hat_dep = model.addVars(
+        Taches.TACHES_DEPART,
+        list(liste_id_train_depart),
+        vtype=grb.GRB.INTEGER,
+        lb=0,
+        ub=8 * 4 - 1,
+        name="hat_dep",
+    )
+    k_arr = model.addVars(
+        Taches.TACHES_ARRIVEE,
+        list(liste_id_train_arrivee),
+        vtype=grb.GRB.INTEGER,
+        lb=0,
+        name="k_arr",
+    )
+    k_dep = model.addVars(
+        Taches.TACHES_DEPART,
+        list(liste_id_train_depart),
+        vtype=grb.GRB.INTEGER,
+        lb=0,
+        name="k_dep",
+    )
     return hat_arr, hat_dep, k_arr, k_dep
 
 
@@ -622,60 +631,52 @@ def init_objectif(
     M_big = K
     eps = 0.1
 
-    delta_arr = {
-        (k, m, n, x): model.addVar(vtype=grb.GRB.BINARY, name="delta_arr_{k}_{m}_{n}")
-        for n in liste_id_train_arrivee
-        for m in Taches.TACHES_ARRIVEE
-        for k in range(K)
-        for x in [-1, 0, 1]
-    }
-    delta_dep = {
-        (k, m, n, x): model.addVar(vtype=grb.GRB.BINARY, name="delta_dep_{k}_{m}_{n}")
-        for n in liste_id_train_depart
-        for m in Taches.TACHES_DEPART
-        for k in range(K)
-        for x in [-1, 0, 1]
-    }
+    delta_arr = model.addVars(
+        range(K),
+        Taches.TACHES_ARRIVEE,
+        list(liste_id_train_arrivee),
+        [-1, 0, 1],
+        vtype=grb.GRB.BINARY,
+        name="delta_arr",
+    )
+    delta_dep = model.addVars(
+        range(K),
+        Taches.TACHES_DEPART,
+        list(liste_id_train_depart),
+        [-1, 0, 1],
+        vtype=grb.GRB.BINARY,
+        name="delta_dep",
+    )
 
     max_t = model.addVar(vtype=grb.GRB.INTEGER, lb=0, name="max_t")
 
+    # Une famille de contraintes par appel, plutôt qu'un appel par contrainte
+    for k_taches, delta, taches, liste_id in (
+        (k_arr, delta_arr, Taches.TACHES_ARRIVEE, liste_id_train_arrivee),
+        (k_dep, delta_dep, Taches.TACHES_DEPART, liste_id_train_depart),
+    ):
+        indices = [(k, m, n) for k in range(K) for n in liste_id for m in taches]
+        model.addConstrs(
+            k_taches[m, n] - k + eps <= M_big * delta[k, m, n, 1] for k, m, n in indices
+        )
+        model.addConstrs(
+            k - k_taches[m, n] - eps <= M_big * (1 - delta[k, m, n, 1])
+            for k, m, n in indices
+        )
+        model.addConstrs(
+            k - k_taches[m, n] + eps <= M_big * delta[k, m, n, -1]
+            for k, m, n in indices
+        )
+        model.addConstrs(
+            k_taches[m, n] - k - eps <= M_big * (1 - delta[k, m, n, -1])
+            for k, m, n in indices
+        )
+        model.addConstrs(
+            delta[k, m, n, 0] >= delta[k, m, n, 1] + delta[k, m, n, -1] - 1
+            for k, m, n in indices
+        )
+
     for k in range(K):
-        for n in liste_id_train_arrivee:
-            for m in Taches.TACHES_ARRIVEE:
-                model.addConstr(k_arr[m, n] - k + eps <=
-                                M_big * delta_arr[k, m, n, 1])
-                model.addConstr(
-                    k - k_arr[m, n] - eps <= M_big *
-                    (1 - delta_arr[k, m, n, 1])
-                )
-                model.addConstr(k - k_arr[m, n] + eps <=
-                                M_big * delta_arr[k, m, n, -1])
-                model.addConstr(
-                    k_arr[m, n] - k - eps <= M_big *
-                    (1 - delta_arr[k, m, n, -1])
-                )
-                model.addConstr(
-                    delta_arr[k, m, n, 0] >= delta_arr[k,
-                                                       m, n, 1]+delta_arr[k, m, n, -1]-1
-                )
-        for n in liste_id_train_depart:
-            for m in Taches.TACHES_DEPART:
-                model.addConstr(k_dep[m, n] - k + eps <=
-                                M_big * delta_dep[k, m, n, 1])
-                model.addConstr(
-                    k - k_dep[m, n] - eps <= M_big *
-                    (1 - delta_dep[k, m, n, 1])
-                )
-                model.addConstr(k - k_dep[m, n] + eps <=
-                                M_big * delta_dep[k, m, n, -1])
-                model.addConstr(
-                    k_dep[m, n] - k - eps <= M_big *
-                    (1 - delta_dep[k, m, n, -1])
-                )
-                model.addConstr(
-                    delta_dep[k, m, n, 0] >= delta_dep[k,
-                                                       m, n, 1]+delta_dep[k, m, n, -1]-1
-                )
         model.addConstr(
             max_t
             >= grb.quicksum(
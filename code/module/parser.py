@@ -62,27 +62,171 @@ Fonctions principales :
 Dépendances :
 -------------
 - pandas
+- csv
 - datetime
+- functools
+- hashlib
 - itertools
 - math
+- numpy
+- pickle
+- pyarrow (optionnel)
+- python-calamine (optionnel)
 - autres modules spécifiques du projet (ex : Constantes, Colonnes)
 """
 
+import csv
+import hashlib
+import os
+import pickle
+from collections.abc import Iterable, Iterator
 from datetime import datetime, timedelta
+from functools import lru_cache
 from itertools import chain
 from math import ceil
+from typing import Literal
 
+import numpy as np
 import pandas as pd
 
+try:  # Lecteur Excel compilé (Rust), nettement plus rapide qu'openpyxl
+    import python_calamine  # noqa: F401
+
+    MOTEUR_EXCEL = "calamine"
+except ImportError:
+    MOTEUR_EXCEL = "openpyxl"
+
+try:  # Chaînes Arrow : concaténations faites en C++ plutôt qu'objet par objet
+    import pyarrow  # noqa: F401
+
+    TYPE_CHAINE = "string[pyarrow]"
+except ImportError:
+    TYPE_CHAINE = "string"
+
 from module.constants import Chantiers, Colonnes, Feuilles, Machines, Taches
 from module.tools import (
-    convert_hour_to_minutes,
-    convertir_en_minutes,
+    convertir_en_minutes_batch,
+    convertir_heures_en_minutes,
     traitement_doublons,
 )
 
 # ----- dataframes ----- #
 
+# Seules feuilles du classeur lues par le parser
+FEUILLES_UTILISEES = [
+    Feuilles.SILLONS_ARRIVEE,
+    Feuilles.SILLONS_DEPART,
+    Feuilles.CORRESPONDANCES,
+    Feuilles.CHANTIERS,
+    Feuilles.MACHINES,
+    Feuilles.ROULEMENT_AGENTS,
+    Feuilles.TACHES_HUMAINES,
+]
+
+# Heures des sillons lues directement comme chaînes : pas d'inférence de type,
+# elles sont de toute façon analysées comme "hh:mm" ensuite
+TYPES_COLONNES = {Colonnes.SILLON_HARR: str, Colonnes.SILLON_HDEP: str}
+
+# Dossier du cache disque des feuilles lues, propre à l'utilisateur
+DOSSIER_CACHE = os.path.join(
+    os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"),
+    "optiFretSNCF",
+)
+
+
+def _lire_feuilles(file_path: str) -> dict:
+    """
+    Lit les feuilles utiles d'un fichier Excel.
+
+    Paramètres :
+    ------------
+    file_path : str
+        Chemin du fichier Excel à charger.
+
+    Retourne :
+    ----------
+    dict
+        Dictionnaire nom de feuille -> DataFrame.
+    """
+    if MOTEUR_EXCEL == "calamine":
+        return pd.read_excel(
+            file_path,
+            sheet_name=FEUILLES_UTILISEES,
+            dtype=TYPES_COLONNES,
+            engine="calamine",
+        )
+    return pd.read_excel(
+        file_path,
+        sheet_name=FEUILLES_UTILISEES,
+        dtype=TYPES_COLONNES,
+        engine="openpyxl",
+        engine_kwargs={"read_only": True, "data_only": True},
+    )
+
+
+@lru_cache(maxsize=8)
+def _read_all_sheets(file_path: str, mtime: float) -> dict:
+    """
+    Lit les feuilles utiles d'un fichier Excel, avec mise en cache.
+
+    La date de modification fait partie de la clé du cache : un fichier
+    modifié sur le disque est donc relu. Les feuilles lues sont aussi
+    conservées dans un fichier pickle du dossier de cache de l'utilisateur
+    (DOSSIER_CACHE), réutilisé d'une session à l'autre tant que le classeur
+    et les réglages de lecture (moteur Excel, type des chaînes) n'ont pas
+    changé. Il n'est jamais écrit à côté du classeur : un fichier déposé
+    près des données ne peut donc pas être désérialisé.
+
+    Paramètres :
+    ------------
+    file_path : str
+        Chemin du fichier Excel à charger.
+    mtime : float
+        Date de dernière modification du fichier.
+
+    Retourne :
+    ----------
+    dict
+        Dictionnaire nom de feuille -> DataFrame (partagé par le cache, à ne
+        pas modifier).
+    """
+    cle = (
+        mtime,
+        os.path.getsize(file_path),
+        tuple(FEUILLES_UTILISEES),
+        tuple(TYPES_COLONNES),
+        MOTEUR_EXCEL,
+        str(TYPE_CHAINE),
+    )
+    empreinte = hashlib.sha256(os.path.abspath(file_path).encode()).hexdigest()
+    chemin_cache = os.path.join(DOSSIER_CACHE, f"{empreinte}.pkl")
+
+    try:
+        with open(chemin_cache, "rb") as f:
+            cle_cache, feuilles = pickle.load(f)
+        if cle_cache == cle:
+            return feuilles
+    except (
+        OSError,
+        EOFError,
+        pickle.UnpicklingError,
+        ValueError,
+        ImportError,  # Cache écrit avec pyarrow / calamine absents ici
+        AttributeError,  # Cache écrit par une autre version de pandas
+    ):
+        pass  # Pas de cache exploitable : lecture du classeur
+
+    feuilles = _lire_feuilles(file_path)
+
+    try:
+        os.makedirs(DOSSIER_CACHE, mode=0o700, exist_ok=True)
+        with open(chemin_cache, "wb") as f:
+            pickle.dump((cle, feuilles), f, protocol=pickle.HIGHEST_PROTOCOL)
+    except OSError:
+        pass  # Dossier en lecture seule : on se passe du cache disque
+
+    return feuilles
+
 
 def init_dfs(file_path: str):
     """
@@ -116,7 +260,14 @@ def init_dfs(file_path: str):
             Données des tâches humaines.
     """
 
-    df = pd.read_excel(file_path, sheet_name=None)
+    # Copies profondes : une modification par l'appelant n'atteint pas le
+    # cache (copie négligeable pour des feuilles de cette taille)
+    df = {
+        feuille: df_feuille.copy()
+        for feuille, df_feuille in _read_all_sheets(
+            file_path, os.path.getmtime(file_path)
+        ).items()
+    }
 
     df_sil_arr = init_df_sillon_arr(df)
     df_sil_dep = init_df_sillon_dep(df)
@@ -127,6 +278,11 @@ def init_dfs(file_path: str):
     df_machines = df[Feuilles.MACHINES]
 
     df_roulement_agent = df[Feuilles.ROULEMENT_AGENTS]
+    # Peu de combinaisons de compétences distinctes : les recherches de
+    # sous-chaînes ne portent alors que sur les catégories
+    df_roulement_agent[Colonnes.CONNAISSANCES_CHANTIERS] = df_roulement_agent[
+        Colonnes.CONNAISSANCES_CHANTIERS
+    ].astype("category")
     df_taches_humaines = df[Feuilles.TACHES_HUMAINES]
 
     return (
@@ -157,10 +313,11 @@ def init_df_sillon_arr(df: pd.DataFrame) -> pd.DataFrame:
     """
 
     df_sil_arr = df[Feuilles.SILLONS_ARRIVEE]
-    df_sil_arr[Colonnes.SILLON_JARR] = pd.to_datetime(
-        df_sil_arr[Colonnes.SILLON_JARR], format="%d/%m/%Y", errors="coerce"
-    )
-    return df_sil_arr
+    jours = df_sil_arr[Colonnes.SILLON_JARR]
+    # openpyxl peut déjà fournir des dates : inutile de les analyser à nouveau
+    if not pd.api.types.is_datetime64_any_dtype(jours):
+        jours = pd.to_datetime(jours, format="%d/%m/%Y", errors="coerce")
+    return df_sil_arr.assign(**{Colonnes.SILLON_JARR: jours})
 
 
 def init_df_sillon_dep(df: pd.DataFrame) -> pd.DataFrame:
@@ -178,10 +335,10 @@ def init_df_sillon_dep(df: pd.DataFrame) -> pd.DataFrame:
         Données des sillons de départ avec les dates formatées.
     """
     df_sil_dep = df[Feuilles.SILLONS_DEPART]
-    df_sil_dep[Colonnes.SILLON_JDEP] = pd.to_datetime(
-        df_sil_dep[Colonnes.SILLON_JDEP], format="%d/%m/%Y", errors="coerce"
-    )
-    return df_sil_dep
+    jours = df_sil_dep[Colonnes.SILLON_JDEP]
+    if not pd.api.types.is_datetime64_any_dtype(jours):
+        jours = pd.to_datetime(jours, format="%d/%m/%Y", errors="coerce")
+    return df_sil_dep.assign(**{Colonnes.SILLON_JDEP: jours})
 
 
 def init_df_correspondances(df: pd.DataFrame) -> pd.DataFrame:
@@ -198,26 +355,28 @@ def init_df_correspondances(df: pd.DataFrame) -> pd.DataFrame:
     pd.DataFrame
         Données des correspondances avec les identifiants de trains générés.
     """
-    input_df = df[Feuilles.CORRESPONDANCES].copy().astype(str)
-
-    input_df[Colonnes.ID_TRAIN_ARRIVEE] = (
-        input_df[Colonnes.N_TRAIN_ARRIVEE]
-        + "_"
-        + pd.to_datetime(
-            input_df[Colonnes.DATE_ARRIVEE], format="%d/%m/%Y", errors="coerce"
-        ).dt.strftime("%d")
+    df_cor = df[Feuilles.CORRESPONDANCES]
+
+    # Seules les colonnes servant aux identifiants sont converties, et les dates
+    # déjà lues comme datetime64 ne sont pas réanalysées
+    jours = {}
+    for colonne in (Colonnes.DATE_ARRIVEE, Colonnes.DATE_DEPART):
+        dates = df_cor[colonne]
+        if not pd.api.types.is_datetime64_any_dtype(dates):
+            dates = pd.to_datetime(dates, format="%d/%m/%Y", errors="coerce")
+        jours[colonne] = dates.dt.strftime("%d").astype(TYPE_CHAINE)
+
+    return df_cor.assign(
+        **{
+            Colonnes.ID_TRAIN_ARRIVEE: df_cor[Colonnes.N_TRAIN_ARRIVEE]
+            .astype(TYPE_CHAINE)
+            .str.cat(jours[Colonnes.DATE_ARRIVEE], sep="_"),
+            Colonnes.ID_TRAIN_DEPART: df_cor[Colonnes.N_TRAIN_DEPART]
+            .astype(TYPE_CHAINE)
+            .str.cat(jours[Colonnes.DATE_DEPART], sep="_"),
+        }
     )
 
-    input_df[Colonnes.ID_TRAIN_DEPART] = (
-        input_df[Colonnes.N_TRAIN_DEPART]
-        + "_"
-        + pd.to_datetime(
-            input_df[Colonnes.DATE_DEPART], format="%d/%m/%Y", errors="coerce"
-        ).dt.strftime("%d")
-    )
-
-    return input_df
-
 
 # ----- values ----- #
 
@@ -236,53 +395,8 @@ def skibidi_mondays(date: datetime) -> datetime:
     datetime
         Date correspondant au lundi de la semaine en cours.
     """
-    jour_semaine = date.weekday()
-    delta = timedelta(days=jour_semaine)
-    return (date - delta).replace(hour=0, minute=0, microsecond=0)
-
-
-def init_first_arr(df_sillons_arr: pd.DataFrame) -> datetime:
-    """
-    Calcule la première date et heure d'arrivée parmi les sillons.
-
-    Paramètres :
-    ------------
-    df_sillons_arr : pd.DataFrame
-        DataFrame contenant les sillons d'arrivée.
-
-    Retourne :
-    ----------
-    datetime
-        Date et heure de la première arrivée enregistrée.
-    """
-    df_sillons_arr["Datetime"] = pd.to_datetime(
-        df_sillons_arr[Colonnes.SILLON_JARR].astype(str)
-        + " "
-        + df_sillons_arr[Colonnes.SILLON_HARR].astype(str)
-    )
-    return df_sillons_arr["Datetime"].min()
-
-
-def init_last_dep(df_sillons_dep: pd.DataFrame) -> datetime:
-    """
-    Calcule la dernière date et heure de départ parmi les sillons.
-
-    Paramètres :
-    ------------
-    df_sillons_dep : pd.DataFrame
-        DataFrame contenant les sillons de départ.
-
-    Retourne :
-    ----------
-    datetime
-        Date et heure du dernier départ enregistré.
-    """
-    df_sillons_dep["Datetime"] = pd.to_datetime(
-        df_sillons_dep[Colonnes.SILLON_JDEP].astype(str)
-        + " "
-        + df_sillons_dep[Colonnes.SILLON_HDEP].astype(str)
-    )
-    return df_sillons_dep["Datetime"].max()
+    date = pd.Timestamp(date)
+    return date.normalize() - pd.Timedelta(days=date.weekday())
 
 
 def nombre_roulements(df_roulement_agent: pd.DataFrame) -> int:
@@ -299,8 +413,7 @@ def nombre_roulements(df_roulement_agent: pd.DataFrame) -> int:
     int
         Nombre total de roulements enregistrés.
     """
-    count = df_roulement_agent[Colonnes.ROULEMENT].count()
-    return count
+    return len(df_roulement_agent.index)
 
 
 def init_values(
@@ -329,8 +442,29 @@ def init_values(
         - datetime : Date du lundi de référence.
         - int : Nombre total de roulements d'agents.
     """
-    first_arr = init_first_arr(df_sillons_arr)
-    last_dep = init_last_dep(df_sillons_dep)
+    # Une seule construction des horodatages par feuille : jour + minutes de l'heure,
+    # sans concaténation de chaînes ni analyse "hh:mm:ss" par to_timedelta
+    dates_arr = (
+        df_sillons_arr[Colonnes.SILLON_JARR].to_numpy()
+        + pd.to_timedelta(
+            convertir_heures_en_minutes(
+                df_sillons_arr[Colonnes.SILLON_HARR].astype(str).str.slice(0, 5)
+            ),
+            unit="m",
+        ).to_numpy()
+    )
+    dates_dep = (
+        df_sillons_dep[Colonnes.SILLON_JDEP].to_numpy()
+        + pd.to_timedelta(
+            convertir_heures_en_minutes(
+                df_sillons_dep[Colonnes.SILLON_HDEP].astype(str).str.slice(0, 5)
+            ),
+            unit="m",
+        ).to_numpy()
+    )
+
+    first_arr = pd.Timestamp(np.nanmin(dates_arr))
+    last_dep = pd.Timestamp(np.nanmax(dates_dep))
 
     monday = skibidi_mondays(first_arr)
 
@@ -348,6 +482,46 @@ def init_values(
 # ----- dicts ----- #
 
 
+def _minutes_depuis_lundi(
+    df_sillons: pd.DataFrame, colonne_jour: str, colonne_heure: str, monday: datetime
+) -> dict:
+    """
+    Calcule, pour chaque sillon, les minutes écoulées depuis le lundi de référence.
+
+    Paramètres :
+    ------------
+    df_sillons : pd.DataFrame
+        Sillons d'arrivée ou de départ.
+    colonne_jour : str
+        Colonne des jours (datetime64).
+    colonne_heure : str
+        Colonne des heures au format "hh:mm".
+    monday : datetime
+        Date du lundi de référence.
+
+    Retourne :
+    ----------
+    dict
+        Dictionnaire identifiant unique du train -> minutes depuis le lundi. Les
+        sillons sans jour ou sans heure "hh:mm" valide sont ignorés.
+    """
+    jours = df_sillons[colonne_jour]
+    minutes = convertir_heures_en_minutes(df_sillons[colonne_heure].astype(str))
+
+    valides = jours.notna() & minutes.notna()
+    jours = jours[valides]
+
+    # ID unique : Train_ID_Date, car certains trains portant le même ID passent
+    # sur des jours différents
+    ids = (
+        df_sillons.loc[valides, Colonnes.SILLON_NUM_TRAIN].astype(str)
+        + "_"
+        + jours.dt.strftime("%d")
+    )
+    minutes_depuis_lundi = (jours - monday).dt.days * 1440 + minutes[valides]
+    return dict(zip(ids, minutes_depuis_lundi.astype(np.int64).tolist()))
+
+
 def init_dict_t_a(df_sillons_arr: pd.DataFrame, monday: datetime) -> dict:
     """
     Crée un dictionnaire des minutes écoulées depuis une date de référence pour
@@ -368,24 +542,9 @@ def init_dict_t_a(df_sillons_arr: pd.DataFrame, monday: datetime) -> dict:
         dict: Dictionnaire avec des identifiants uniques de trains comme clés et les
               minutes écoulées depuis la date de référence comme valeurs.
     """
-    t_a = {}
-    for _, row in df_sillons_arr.iterrows():
-        train_id = row[Colonnes.SILLON_NUM_TRAIN]
-        date_arr = row[Colonnes.SILLON_JARR]
-        heure_arr = convert_hour_to_minutes(
-            row[Colonnes.SILLON_HARR]
-        )  # Conversion heure → minutes
-
-        if pd.notna(date_arr) and heure_arr is not None:
-            # Nombre de jours depuis le 08/08
-            days_since_ref = (date_arr - monday).days
-            minutes_since_ref = (days_since_ref * 1440) + heure_arr  # Ajout des minutes
-
-            # Création d'un ID unique : Train_ID_Date, car certains trains portant le même ID passent sur des jours différents
-            train_id_unique = f"{train_id}_{date_arr.strftime('%d')}"
-
-            t_a[train_id_unique] = minutes_since_ref
-    return t_a
+    return _minutes_depuis_lundi(
+        df_sillons_arr, Colonnes.SILLON_JARR, Colonnes.SILLON_HARR, monday
+    )
 
 
 def init_dict_t_d(df_sillons_dep: pd.DataFrame, monday: datetime) -> dict:
@@ -408,24 +567,9 @@ def init_dict_t_d(df_sillons_dep: pd.DataFrame, monday: datetime) -> dict:
         dict: Dictionnaire avec des identifiants uniques de trains comme clés et les
               minutes écoulées depuis la date de référence comme valeurs.
     """
-    t_d = {}
-    for _, row in df_sillons_dep.iterrows():
-        train_id = row[Colonnes.SILLON_NUM_TRAIN]
-        date_dep = row[Colonnes.SILLON_JDEP]
-        heure_dep = convert_hour_to_minutes(
-            row[Colonnes.SILLON_HDEP]
-        )  # Conversion heure → minutes
-
-        if pd.notna(date_dep) and heure_dep is not None:
-            # Nombre de jours depuis le 08/08
-            days_since_ref = (date_dep - monday).days
-            minutes_since_ref = (days_since_ref * 1440) + heure_dep  # Ajout des minutes
-
-            # Création d'un ID unique : Train_ID_Date
-            train_id_unique = f"{train_id}_{date_dep.strftime('%d')}"
-
-            t_d[train_id_unique] = minutes_since_ref
-    return t_d
+    return _minutes_depuis_lundi(
+        df_sillons_dep, Colonnes.SILLON_JDEP, Colonnes.SILLON_HDEP, monday
+    )
 
 
 def init_dict_correspondances(df_correspondance: pd.DataFrame) -> dict:
@@ -444,16 +588,39 @@ def init_dict_correspondances(df_correspondance: pd.DataFrame) -> dict:
         dict: Dictionnaire où chaque clé est un identifiant de train de départ et chaque
               valeur est une liste d'identifiants de trains d'arrivée correspondants.
     """
-    input_df = df_correspondance
-    d = {}
-    for departure_train_id in input_df[Colonnes.ID_TRAIN_DEPART]:
-        d[departure_train_id] = []
-    for arrival_train_id, departure_train_id in zip(
-        input_df[Colonnes.ID_TRAIN_ARRIVEE],
-        input_df[Colonnes.ID_TRAIN_DEPART],
-    ):
-        d[departure_train_id].append(arrival_train_id)
-    return d
+    return (
+        df_correspondance.groupby(Colonnes.ID_TRAIN_DEPART, sort=False, dropna=False)[
+            Colonnes.ID_TRAIN_ARRIVEE
+        ]
+        .agg(list)
+        .to_dict()
+    )
+
+
+def _init_dict_limites(
+    df_ressources: pd.DataFrame, dernier_depart: float, cles: tuple
+) -> dict:
+    """
+    Convertit les indisponibilités des ressources (chantiers ou machines) en
+    listes de limites en minutes, associées aux clés dans l'ordre des lignes.
+
+    Args:
+        df_ressources (pd.DataFrame): DataFrame des chantiers ou des machines,
+                                      y compris les indisponibilités.
+        dernier_depart (float): Heure du dernier départ en minutes depuis
+                                la référence.
+        cles (tuple): Clé de chaque ligne, dans l'ordre du DataFrame.
+
+    Returns:
+        dict: Dictionnaire clé -> liste des limites de disponibilité.
+    """
+    limites = traitement_doublons(
+        convertir_en_minutes_batch(
+            df_ressources[Colonnes.INDISPONIBILITE].astype(str).tolist(),
+            dernier_depart,
+        )
+    )
+    return {cle: limites[i] for i, cle in enumerate(cles)}
 
 
 def init_dict_limites_chantiers(
@@ -477,27 +644,9 @@ def init_dict_limites_chantiers(
               correspondant aux types de chantiers (REC, FOR, DEP) et des valeurs
               représentant les listes de limites de disponibilité.
     """
-    indisponibilites_chantiers = df_chantiers[Colonnes.INDISPONIBILITE_MINUTES] = (
-        df_chantiers[Colonnes.INDISPONIBILITE]
-        .astype(str)
-        .apply(lambda x: convertir_en_minutes(x, dernier_depart))
+    return _init_dict_limites(
+        df_chantiers, dernier_depart, (Chantiers.REC, Chantiers.FOR, Chantiers.DEP)
     )
-    listes_plates_chantiers = indisponibilites_chantiers.apply(
-        lambda x: list(chain(*x))
-    )
-
-    limites_chantiers = []
-    for liste in listes_plates_chantiers:
-        limites_chantiers.append(liste)
-
-    limites_chantiers = traitement_doublons(limites_chantiers)
-
-    limites_chantiers_dict = {
-        Chantiers.REC: limites_chantiers[0],
-        Chantiers.FOR: limites_chantiers[1],
-        Chantiers.DEP: limites_chantiers[2],
-    }
-    return limites_chantiers_dict
 
 
 def init_dict_limites_machines(
@@ -522,27 +671,10 @@ def init_dict_limites_machines(
               clés correspondant aux types de machines (DEB, FOR, DEG) et des
               valeurs représentant les listes de limites de disponibilité.
     """
-    indisponibilites_machines = df_machines[Colonnes.INDISPONIBILITE_MINUTES] = (
-        df_machines[Colonnes.INDISPONIBILITE]
-        .astype(str)
-        .apply(lambda x: convertir_en_minutes(x, dernier_depart))
+    return _init_dict_limites(
+        df_machines, dernier_depart, (Machines.DEB, Machines.FOR, Machines.DEG)
     )
 
-    listes_plates_machines = indisponibilites_machines.apply(lambda x: list(chain(*x)))
-
-    limites_machines = []
-    for liste in listes_plates_machines:
-        limites_machines.append(liste)
-
-    limites_machines = traitement_doublons(limites_machines)
-    limites_machines = {
-        Machines.DEB: limites_machines[0],
-        Machines.FOR: limites_machines[1],
-        Machines.DEG: limites_machines[2],
-    }
-
-    return limites_machines
-
 
 def init_dict_limites_voies(df_chantiers: pd.DataFrame) -> dict:
     """
@@ -560,10 +692,11 @@ def init_dict_limites_voies(df_chantiers: pd.DataFrame) -> dict:
         dict: Dictionnaire avec les types de chantiers (REC, FOR, DEP) comme
               clés et le nombre de voies disponibles comme valeurs.
     """
+    voies = df_chantiers[Colonnes.NOMBRE_VOIES].iloc[:3].astype(int).to_numpy()
     limites_chantiers_voies = {
-        Chantiers.REC: int(df_chantiers[Colonnes.NOMBRE_VOIES].astype(str)[0]),
-        Chantiers.FOR: int(df_chantiers[Colonnes.NOMBRE_VOIES].astype(str)[1]),
-        Chantiers.DEP: int(df_chantiers[Colonnes.NOMBRE_VOIES].astype(str)[2]),
+        Chantiers.REC: int(voies[0]),
+        Chantiers.FOR: int(voies[1]),
+        Chantiers.DEP: int(voies[2]),
     }
     return limites_chantiers_voies
 
@@ -586,14 +719,43 @@ def init_dict_nombre_max_agents_sur_roulement(
         dict: Dictionnaire avec les numéros de roulement comme clés et le
               nombre maximal d'agents comme valeurs.
     """
-    n_agent = {
-        r + 1: df_roulement_agent.at[r, Colonnes.NOMBRE_AGENTS]
-        for r in df_roulement_agent.index
-    }
+    n_agent = dict(
+        enumerate(
+            df_roulement_agent[Colonnes.NOMBRE_AGENTS].to_numpy().tolist(), start=1
+        )
+    )
 
     return n_agent
 
 
+def _possede_connaissances(connaissances: pd.Series, motifs: tuple) -> np.ndarray:
+    """
+    Indique, pour chaque roulement, quels motifs apparaissent dans ses
+    connaissances chantiers.
+
+    Les motifs sont cherchés une seule fois par valeur distincte de la colonne
+    (peu nombreuses), puis le résultat est propagé aux lignes par les codes de
+    catégorie.
+
+    Args:
+        connaissances (pd.Series): Colonne des connaissances chantiers.
+        motifs (tuple): Sous-chaînes recherchées.
+
+    Returns:
+        np.ndarray: Matrice booléenne (nombre de roulements, nombre de motifs).
+    """
+    if not isinstance(connaissances.dtype, pd.CategoricalDtype):
+        connaissances = connaissances.astype("category")
+
+    # Une ligne par catégorie, plus une ligne de False pour les valeurs
+    # manquantes (code -1)
+    presence = np.zeros((len(connaissances.cat.categories) + 1, len(motifs)), bool)
+    for i, valeur in enumerate(connaissances.cat.categories.astype(str)):
+        presence[i] = [motif in valeur for motif in motifs]
+
+    return presence[connaissances.cat.codes.to_numpy()]
+
+
 def init_dict_roulements_operants_sur_tache(
     df_roulement_agent: pd.DataFrame,
 ) -> dict:
@@ -612,33 +774,18 @@ def init_dict_roulements_operants_sur_tache(
         dict: Dictionnaire où les clés sont des tuples (tâche, machine) et les
               valeurs sont des listes de roulements pouvant opérer sur ces tâches.
     """
-    roulements_operants_sur_m = {}
-    for m in [1, 2, 3]:
-        roulements_operants_sur_m[("arr", m)] = (
-            df_roulement_agent[
-                df_roulement_agent[Colonnes.CONNAISSANCES_CHANTIERS].str.contains(
-                    "REC", na=False
-                )
-            ].index
-            + 1
-        ).tolist()
-        roulements_operants_sur_m[("dep", m)] = (
-            df_roulement_agent[
-                df_roulement_agent[Colonnes.CONNAISSANCES_CHANTIERS].str.contains(
-                    "FOR", na=False
-                )
-            ].index
-            + 1
-        ).tolist()
-    for m in [4]:
-        roulements_operants_sur_m[("dep", m)] = (
-            df_roulement_agent[
-                df_roulement_agent[Colonnes.CONNAISSANCES_CHANTIERS].str.contains(
-                    "DEP", na=False
-                )
-            ].index
-            + 1
-        ).tolist()
+    rec, for_, dep = _possede_connaissances(
+        df_roulement_agent[Colonnes.CONNAISSANCES_CHANTIERS], ("REC", "FOR", "DEP")
+    ).T
+    roulements_rec = (df_roulement_agent.index[rec] + 1).tolist()
+    roulements_for = (df_roulement_agent.index[for_] + 1).tolist()
+    roulements_dep = (df_roulement_agent.index[dep] + 1).tolist()
+
+    roulements_operants_sur_m = (
+        {("arr", m): roulements_rec for m in (1, 2, 3)}
+        | {("dep", m): roulements_for for m in (1, 2, 3)}
+        | {("dep", 4): roulements_dep}
+    )
     return roulements_operants_sur_m
 
 
@@ -679,36 +826,33 @@ def init_dicts_heure_debut_roulement(
         for i, row in enumerate(df_roulement_agent["Jours de la semaine"].dropna())
     }
 
+    # Heures de début des cycles ("HH:MM-HH:MM") en minutes depuis minuit, triées
     h_deb_jour = {
-        i + 1: sorted(
-            [
-                timedelta(hours=int(x[:2]), minutes=int(x[3:5]))
-                for x in str(row).split(";")
-            ]
+        i + 1: np.sort(
+            pd.to_timedelta(pd.Series(str(row).split(";")).str.slice(0, 5) + ":00")
+            .to_numpy()
+            .astype("timedelta64[m]")
+            .astype(np.int64)
         )
         for i, row in enumerate(df_roulement_agent["Cycles horaires"].dropna())
     }
 
     nb_cycle_jour = {r: len(h_deb_jour[r]) for r in h_deb_jour}
 
-    jour_de_la_semaine = monday
-    dernier_jour_de_la_semaine = jour_de_la_semaine + timedelta(days=delta_jours)
-
-    h_deb0 = {i + 1: [] for i in range(nb_roulements)}
-
-    while jour_de_la_semaine <= dernier_jour_de_la_semaine:
-        for r in range(1, nb_roulements + 1):
-            if (jour_de_la_semaine.weekday()) % 7 + 1 in jour_semaine_disponibilite[r]:
-                h_deb0[r] += [jour_de_la_semaine + t for t in h_deb_jour[r]]
-        jour_de_la_semaine += timedelta(days=1)
-
-    nb_cycles_agents = {r: len(h_deb0[r]) for r in h_deb0}
+    # Jours de l'horizon, directement en minutes depuis le lundi de référence
+    jours_semaine = (np.arange(delta_jours + 1) + monday.weekday()) % 7 + 1
+    jours_minutes = np.arange(delta_jours + 1, dtype=np.int64) * 1440
 
-    h_deb = {
-        (r, k + 1): int((h_deb0[r][k] - monday).total_seconds() / 60)
-        for r in range(1, nb_roulements + 1)
-        for k in range(nb_cycles_agents[r])
-    }
+    # Début de chaque cycle = jour disponible + horaire de début du cycle
+    h_deb = {}
+    nb_cycles_agents = {}
+    for r in range(1, nb_roulements + 1):
+        jours_disponibles = jours_minutes[
+            np.isin(jours_semaine, jour_semaine_disponibilite[r])
+        ]
+        minutes = (jours_disponibles[:, None] + h_deb_jour[r][None, :]).ravel()
+        nb_cycles_agents[r] = len(minutes)
+        h_deb.update({(r, k + 1): v for k, v in enumerate(minutes.tolist())})
 
     return h_deb, nb_cycles_agents, nb_cycle_jour
 
@@ -732,19 +876,16 @@ def init_dicts_comp(df_roulement_agent: pd.DataFrame) -> tuple[dict, dict]:
             - dict comp_dep: Dictionnaire des compétences des agents pour
               le départ, structuré de la même manière.
     """
-    comp_arr = {}
-    comp_dep = {}
-
-    for r in range(1, len(df_roulement_agent) + 1):
-        comp_arr[r] = []
-        comp_dep[r] = []
-        value = str(df_roulement_agent.loc[r - 1, "Connaissances chantiers"])
-        if "WPY_REC" in value:
-            comp_arr[r] += [1, 2, 3]
-        if "WPY_FOR" in value:
-            comp_dep[r] += [1, 2, 3]
-        if "WPY_DEP" in value:
-            comp_dep[r] += [4]
+    rec, for_, dep = _possede_connaissances(
+        df_roulement_agent[Colonnes.CONNAISSANCES_CHANTIERS],
+        ("WPY_REC", "WPY_FOR", "WPY_DEP"),
+    ).T
+
+    comp_arr = {r + 1: [1, 2, 3] if rec[r] else [] for r in range(len(rec))}
+    comp_dep = {
+        r + 1: ([1, 2, 3] if for_[r] else []) + ([4] if dep[r] else [])
+        for r in range(len(rec))
+    }
 
     return comp_arr, comp_dep
 
@@ -938,6 +1079,137 @@ def lightning_mcqueen_parser(file_path: str):
 
 # ----- writting files -----#
 
+COLONNES_TACHES_MACHINE = (
+    "Id tâche",
+    "Type de tâche",
+    "Jour",
+    "Heure de début",
+    "Durée",
+    "Sillon",
+)
+
+COLONNES_ROULEMENTS_AGENTS = (
+    "Id JS",
+    "Ordre T",
+    "Type T",
+    "Sillon",
+    "Début T",
+    "Durée T",
+    "Lieu T",
+    "Roulement",
+)
+
+
+def _ecrire_lignes(
+    writer: pd.ExcelWriter, nom_feuille: str, entetes: tuple, lignes: Iterable
+) -> None:
+    """
+    Écrit des lignes directement dans une feuille, sans passer par un DataFrame.
+
+    Paramètres :
+    ------------
+    writer : pd.ExcelWriter
+        Classeur de sortie (moteur xlsxwriter).
+    nom_feuille : str
+        Nom de la feuille à créer.
+    entetes : tuple
+        Noms des colonnes.
+    lignes : Iterable
+        Lignes (tuples) à écrire, dans l'ordre des colonnes.
+    """
+    feuille = writer.book.add_worksheet(nom_feuille)
+    feuille.write_row(0, 0, entetes)
+    for i, ligne in enumerate(lignes, start=1):
+        feuille.write_row(i, 0, ligne)
+
+
+def _ecrire_trame(writer: pd.ExcelWriter, nom_feuille: str, df: pd.DataFrame) -> None:
+    """
+    Écrit un DataFrame ligne par ligne dans une feuille, sans son index.
+
+    Les valeurs manquantes (NaN, NaT) sont écrites comme des cellules vides,
+    comme le fait to_excel ; xlsxwriter refuse d'écrire un NaN.
+
+    Paramètres :
+    ------------
+    writer : pd.ExcelWriter
+        Classeur de sortie (moteur xlsxwriter).
+    nom_feuille : str
+        Nom de la feuille à créer.
+    df : pd.DataFrame
+        Données à écrire.
+    """
+    df = df.astype(object).where(df.notna(), None)
+    _ecrire_lignes(
+        writer, nom_feuille, tuple(df.columns), df.itertuples(index=False, name=None)
+    )
+
+
+def _ecrire_csv(chemin: str, entetes: tuple, lignes: Iterable) -> None:
+    """
+    Écrit des lignes dans un fichier CSV, sans passer par un DataFrame.
+
+    Paramètres :
+    ------------
+    chemin : str
+        Chemin du fichier CSV à créer.
+    entetes : tuple
+        Noms des colonnes.
+    lignes : Iterable
+        Lignes (tuples) à écrire, dans l'ordre des colonnes.
+    """
+    with open(chemin, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(entetes)
+        writer.writerows(lignes)
+
+
+def _colonnes_taches(t: dict) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Sépare un dictionnaire de débuts de tâches en colonnes numpy.
+
+    Paramètres :
+    ------------
+    t : dict
+        Valeurs des débuts des tâches, indexées par (ordre, train).
+
+    Retourne :
+    ----------
+    tuple[np.ndarray, np.ndarray, np.ndarray]
+        - Ordres des tâches.
+        - Identifiants des trains.
+        - Débuts des tâches (en quarts d'heure).
+    """
+    ordres = np.fromiter((m for m, _ in t), np.int64, count=len(t))
+    trains = np.array([n for _, n in t], dtype=object)
+    valeurs = np.fromiter(t.values(), float, count=len(t))
+    return ordres, trains, valeurs
+
+
+def _formater_debuts(valeurs: np.ndarray, monday: datetime, format: str) -> dict:
+    """
+    Formate en un seul appel vectorisé des temps exprimés en quarts d'heure.
+
+    Paramètres :
+    ------------
+    valeurs : np.ndarray
+        Temps en intervalles de 15 minutes depuis le lundi de référence.
+    monday : datetime
+        Date du lundi de référence.
+    format : str
+        Format strftime des chaînes produites.
+
+    Retourne :
+    ----------
+    dict
+        Dictionnaire valeur -> chaîne formatée (une entrée par valeur distincte).
+    """
+    uniques = np.unique(valeurs)
+    textes = (pd.Timestamp(monday) + pd.to_timedelta(15 * uniques, unit="m")).strftime(
+        format
+    )
+    return dict(zip(uniques.tolist(), textes))
+
 
 def ecriture_donnees_sortie(
     t_arr: dict,
@@ -960,6 +1232,7 @@ def ecriture_donnees_sortie(
     df_taches_humaines: pd.DataFrame,
     file_name: str,
     monday: datetime,
+    format_sortie: Literal["xlsx", "csv"] = "xlsx",
 ):
     """
     Traite les données pour les mettre dans une feuille de calcul de sortie au format standard.
@@ -967,9 +1240,11 @@ def ecriture_donnees_sortie(
     Paramètres :
     -----------
     t_arr : dict
-        Variables de début des tâches d'arrivée.
+        Débuts des tâches d'arrivée (en quarts d'heure), indexés par
+        (ordre, train).
     t_dep: dict
-        Variables de début des tâches de départ.
+        Débuts des tâches de départ (en quarts d'heure), indexés par
+        (ordre, train).
     occupation_REC : list
         Occupation des voies du chantier de réception en fonction du temps.
     occupation_REC : list
@@ -1006,82 +1281,71 @@ def ecriture_donnees_sortie(
         Nom du fichier de sortie (sans l'extension)
     monday : datetime
         Date du lundi de référence.
+    format_sortie : Literal["xlsx", "csv"]
+        "xlsx" (par défaut) pour un classeur unique, "csv" pour un fichier
+        CSV par feuille (``{file_name}_<feuille>.csv``), bien plus rapide à
+        écrire.
 
     Retourne :
     ---------
     bool
         True si les données sont écrites.
     """
+
+    def taches_machine(
+        colonnes: tuple, ordre: int, type_tache: str, duree: int, sens: str
+    ) -> Iterator[tuple]:
+        """
+        Construit les lignes de sortie d'une tâche machine pour tous les trains.
+
+        Paramètres :
+        ------------
+        colonnes : tuple
+            Ordres, trains et débuts des tâches (voir _colonnes_taches).
+        ordre : int
+            Ordre de la tâche machine.
+        type_tache : str
+            Type de la tâche (DEB, FOR ou DEG).
+        duree : int
+            Durée de la tâche en minutes.
+        sens : str
+            "A" pour une arrivée, "D" pour un départ.
+
+        Retourne :
+        ----------
+        Iterator[tuple]
+            Générateur des lignes de la feuille des tâches machine.
+        """
+        ordres, trains, valeurs = colonnes
+        masque = ordres == ordre
+        return (
+            (
+                f"{type_tache}_{n}#{jours[v]}#{sens}",
+                type_tache,
+                jours[v],
+                heures[v],
+                duree,
+                f"{n}#{jours[v]}#{sens}",
+            )
+            for n, v in zip(trains[masque], valeurs[masque].tolist())
+        )
+
+    colonnes_arr = _colonnes_taches(t_arr)
+    colonnes_dep = _colonnes_taches(t_dep)
+
+    # Jours et heures de début de toutes les tâches, formatés une seule fois
+    valeurs = np.concatenate((colonnes_arr[2], colonnes_dep[2]))
+    jours = _formater_debuts(valeurs, monday, "%d/%m/%Y")
+    heures = _formater_debuts(valeurs, monday, "%H:%M")
+
     # Création des données de sortie
-    xl = (
-        [
-            {
-                "Id tâche": "DEB_"
-                + n_arr
-                + "#"
-                + (monday + timedelta(minutes=15 * var_arr)).strftime("%d/%m/%Y")
-                + "#A",
-                "Type de tâche": "DEB",
-                "Jour": (monday + timedelta(minutes=15 * var_arr)).strftime("%d/%m/%Y"),
-                "Heure de début": (monday + timedelta(minutes=15 * var_arr)).strftime(
-                    "%H:%M"
-                ),
-                "Durée": Taches.T_ARR[m_arr],
-                "Sillon": n_arr
-                + "#"
-                + (monday + timedelta(minutes=15 * var_arr)).strftime("%d/%m/%Y")
-                + "#A",
-            }
-            for (m_arr, n_arr), var_arr in t_arr.items()
-            if m_arr == 3
-        ]
-        + [
-            {
-                "Id tâche": "FOR_"
-                + n_dep
-                + "#"
-                + (monday + timedelta(minutes=15 * var_dep)).strftime("%d/%m/%Y")
-                + "#D",
-                "Type de tâche": "FOR",
-                "Jour": (monday + timedelta(minutes=15 * var_dep)).strftime("%d/%m/%Y"),
-                "Heure de début": (monday + timedelta(minutes=15 * var_dep)).strftime(
-                    "%H:%M"
-                ),
-                "Durée": Taches.T_DEP[m_dep],
-                "Sillon": n_dep
-                + "#"
-                + (monday + timedelta(minutes=15 * var_dep)).strftime("%d/%m/%Y")
-                + "#D",
-            }
-            for (m_dep, n_dep), var_dep in t_dep.items()
-            if m_dep == 1
-        ]
-        + [
-            {
-                "Id tâche": "DEG_"
-                + n_dep
-                + "#"
-                + (monday + timedelta(minutes=15 * var_dep)).strftime("%d/%m/%Y")
-                + "#D",
-                "Type de tâche": "DEG",
-                "Jour": (monday + timedelta(minutes=15 * var_dep)).strftime("%d/%m/%Y"),
-                "Heure de début": (monday + timedelta(minutes=15 * var_dep)).strftime(
-                    "%H:%M"
-                ),
-                "Durée": Taches.T_DEP[m_dep],
-                "Sillon": n_dep
-                + "#"
-                + (monday + timedelta(minutes=15 * var_dep)).strftime("%d/%m/%Y")
-                + "#D",
-            }
-            for (m_dep, n_dep), var_dep in t_dep.items()
-            if m_dep == 3
-        ]
+    # Les lignes sont produites à la demande, pendant l'écriture de la feuille
+    xl = chain(
+        taches_machine(colonnes_arr, 3, "DEB", Taches.T_ARR[3], "A"),
+        taches_machine(colonnes_dep, 1, "FOR", Taches.T_DEP[1], "D"),
+        taches_machine(colonnes_dep, 3, "DEG", Taches.T_DEP[3], "D"),
     )
 
-    # Versement des données de sortie vers une trame de données
-    df_xl = pd.DataFrame(xl)
-
     # Création des données d'occupation des voies de chantier
     xl2 = {
         "Horodatage": x_date,
@@ -1092,6 +1356,11 @@ def ecriture_donnees_sortie(
     # Versement des données d'occupation vers une trame de données
     df_xl2 = pd.DataFrame(xl2)
 
+    # Maximum d'occupation des trois chantiers en une seule réduction
+    max_REC, max_FOR, max_DEP = (
+        np.stack([occupation_REC, occupation_FOR, occupation_DEP]).max(axis=1).tolist()
+    )
+
     xl3 = {
         "Occupation des voies par chantier (optim)": [
             "Taux max d'occupation des voies (en %)",
@@ -1099,25 +1368,25 @@ def ecriture_donnees_sortie(
             "Nombre total de voies à disposition",
         ],
         "WPY_REC": [
-            100 * max(occupation_REC) / limites_voies[Chantiers.REC],
-            max(occupation_REC),
+            100 * max_REC / limites_voies[Chantiers.REC],
+            max_REC,
             limites_voies[Chantiers.REC],
         ],
         "WPY_FOR": [
-            100 * max(occupation_FOR) / limites_voies[Chantiers.FOR],
-            max(occupation_FOR),
+            100 * max_FOR / limites_voies[Chantiers.FOR],
+            max_FOR,
             limites_voies[Chantiers.FOR],
         ],
         "WPY_DEP": [
-            100 * max(occupation_DEP) / limites_voies[Chantiers.DEP],
-            max(occupation_DEP),
+            100 * max_DEP / limites_voies[Chantiers.DEP],
+            max_DEP,
             limites_voies[Chantiers.DEP],
         ],
     }
 
     df_xl3 = pd.DataFrame(xl3)
 
-    df_xl4, df_xl5 = ecriture_donnees_sortie_jalon3(
+    xl4, df_xl5 = ecriture_donnees_sortie_jalon3(
         t_arr,
         t_dep,
         h_deb,
@@ -1135,15 +1404,34 @@ def ecriture_donnees_sortie(
         monday,
     )
 
-    # Versement des trames vers la feuilles de calcul
-    with pd.ExcelWriter(f"{file_name}.xlsx", engine="openpyxl") as writer:
-        df_xl.to_excel(writer, sheet_name="Taches machine", index=False)
-        df_xl2.to_excel(writer, sheet_name="Occupation voie chantier", index=False)
-        df_xl3.to_excel(
-            writer, sheet_name="Statistiques occupation voie chantier", index=False
+    if format_sortie == "csv":
+        _ecrire_csv(f"{file_name}_taches_machine.csv", COLONNES_TACHES_MACHINE, xl)
+        df_xl2.to_csv(f"{file_name}_occupation_voies.csv", index=False)
+        df_xl3.to_csv(f"{file_name}_statistiques_occupation_voies.csv", index=False)
+        _ecrire_csv(
+            f"{file_name}_roulements_agents.csv", COLONNES_ROULEMENTS_AGENTS, xl4
         )
-        df_xl4.to_excel(writer, sheet_name="Roulements agents", index=False)
-        df_xl5.to_excel(writer, sheet_name="Statistiques roulements", index=False)
+        df_xl5.to_csv(f"{file_name}_statistiques_roulements.csv", index=False)
+        return True
+
+    # Versement des trames vers la feuilles de calcul. En mode constant_memory,
+    # xlsxwriter libère chaque ligne dès qu'elle est écrite : toutes les feuilles
+    # sont donc écrites ligne par ligne (to_excel écrit colonne par colonne)
+    with pd.ExcelWriter(
+        f"{file_name}.xlsx",
+        engine="xlsxwriter",
+        engine_kwargs={
+            "options": {
+                "constant_memory": True,
+                "default_date_format": "yyyy-mm-dd hh:mm:ss",
+            }
+        },
+    ) as writer:
+        _ecrire_lignes(writer, "Taches machine", COLONNES_TACHES_MACHINE, xl)
+        _ecrire_trame(writer, "Occupation voie chantier", df_xl2)
+        _ecrire_trame(writer, "Statistiques occupation voies", df_xl3)
+        _ecrire_lignes(writer, "Roulements agents", COLONNES_ROULEMENTS_AGENTS, xl4)
+        _ecrire_trame(writer, "Statistiques roulements", df_xl5)
 
     return True
 
@@ -1164,7 +1452,7 @@ def ecriture_donnees_sortie_jalon3(
     df_roulement_agent: pd.DataFrame,
     df_taches_humaines: pd.DataFrame,
     monday: datetime,
-) -> bool:
+) -> tuple[list, pd.DataFrame]:
     """
     Formate et écrit les données traitées dans une feuille de calcul de sortie.
 
@@ -1203,217 +1491,127 @@ def ecriture_donnees_sortie_jalon3(
 
     Retourne :
     ----------
-    bool
-        True si les données sont correctement écrites.
+    tuple[list, pd.DataFrame]
+        - Lignes (tuples) de la feuille des roulements agents, dans l'ordre
+          de COLONNES_ROULEMENTS_AGENTS.
+        - Statistiques des roulements activés par jour.
     """
-    noms_roulements = {
-        r + 1: df_roulement_agent.at[r, "Roulement"] for r in df_roulement_agent.index
+    noms_roulements = dict(
+        enumerate(df_roulement_agent["Roulement"].to_numpy().tolist(), start=1)
+    )
+    noms_tache = dict(
+        enumerate(
+            df_taches_humaines["Type de tache humaine"].to_numpy().tolist(), start=1
+        )
+    )
+
+    # Débuts des tâches en quarts d'heure entiers, formatés en un seul appel
+    quarts_arr = {
+        cle: int(var.X) if hasattr(var, "X") else int(var) for cle, var in t_arr.items()
     }
-    noms_tache = {
-        m + 1: df_taches_humaines.at[m, "Type de tache humaine"]
-        for m in df_taches_humaines.index
+    quarts_dep = {
+        cle: int(var.X) if hasattr(var, "X") else int(var) for cle, var in t_dep.items()
     }
-
-    def get_time_string(var) -> str:
-        """
-        Convertit une variable Gurobi en chaîne de date et heure formatée.
-
-        Paramètres :
-        ------------
-        var : grb.Var | int
-            Variable Gurobi ou entier représentant un temps en intervalles.
-
-        Retourne :
-        ----------
-        str
-            Chaîne de caractères représentant la date et l'heure formatées.
-        """
-        var_value = int(var.X) if hasattr(var, "X") else int(var)
-        return (monday + timedelta(minutes=15 * var_value)).strftime("%d/%m/%Y %H:%M")
-
-    xl = (
-        [
-            {
-                "Id JS": noms_roulements[r]
-                + "_"
-                + str((h_deb[(r, k)] % 1440) // 60)
-                + "_"
-                + get_time_string(t_arr[1, n_arr]),
-                "Ordre T": 1,
-                "Type T": noms_tache[1],
-                "Sillon": f"{n_arr}#{get_time_string(t_arr[1, n_arr])}#A",
-                "Début T": get_time_string(t_arr[1, n_arr]),
-                "Durée T": Taches.T_ARR[1],
-                "Lieu T": "WPY_REC",
-                "Roulement": noms_roulements[r],
-            }
-            for n_arr in liste_id_train_arrivee
-            for r in equip[("arr", 1)]
-            for k in range(1, nb_cycles_agents[r] + 1)
-            if 15 * t_arr[1, n_arr] >= h_deb[r, k]
-            and 15 * t_arr[1, n_arr] + Taches.T_ARR[1] <= h_deb[r, k] + 8 * 60
-            if who_arr[(1, n_arr, r, k, 3 * t_arr[1, n_arr])].X == 1
-        ]
-        + [
-            {
-                "Id JS": noms_roulements[r]
-                + "_"
-                + str((h_deb[(r, k)] % 1440) // 60)
-                + "_"
-                + get_time_string(t_arr[2, n_arr]),
-                "Ordre T": 2,
-                "Type T": noms_tache[2],
-                "Sillon": f"{n_arr}#{get_time_string(t_arr[2, n_arr])}#A",
-                "Début T": get_time_string(t_arr[2, n_arr]),
-                "Durée T": Taches.T_ARR[2],
-                "Lieu T": "WPY_REC",
-                "Roulement": noms_roulements[r],
-            }
-            for n_arr in liste_id_train_arrivee
-            for r in equip[("arr", 2)]
-            for k in range(1, nb_cycles_agents[r] + 1)
-            if 15 * t_arr[2, n_arr] >= h_deb[r, k]
-            and 15 * t_arr[2, n_arr] + Taches.T_ARR[2] <= h_deb[r, k] + 8 * 60
-            if who_arr[(2, n_arr, r, k, 3 * t_arr[2, n_arr])].X == 1
-        ]
-        + [
-            {
-                "Id JS": noms_roulements[r]
-                + "_"
-                + str((h_deb[(r, k)] % 1440) // 60)
-                + "_"
-                + get_time_string(t_arr[3, n_arr]),
-                "Ordre T": 3,
-                "Type T": noms_tache[3],
-                "Sillon": f"{n_arr}#{get_time_string(t_arr[3, n_arr])}#A",
-                "Début T": get_time_string(t_arr[3, n_arr]),
-                "Durée T": Taches.T_ARR[3],
-                "Lieu T": "WPY_REC",
-                "Roulement": noms_roulements[r],
-            }
-            for n_arr in liste_id_train_arrivee
-            for r in equip[("arr", 3)]
-            for k in range(1, nb_cycles_agents[r] + 1)
-            if 15 * t_arr[3, n_arr] >= h_deb[r, k]
-            and 15 * t_arr[3, n_arr] + Taches.T_ARR[3] <= h_deb[r, k] + 8 * 60
-            if who_arr[(3, n_arr, r, k, 3 * t_arr[3, n_arr])].X == 1
-        ]
-        + [
-            {
-                "Id JS": noms_roulements[r]
-                + "_"
-                + str((h_deb[(r, k)] % 1440) // 60)
-                + "_"
-                + get_time_string(t_dep[3, n_dep]),
-                "Ordre T": 1,
-                "Type T": noms_tache[4],
-                "Sillon": f"{n_dep}#{get_time_string(t_dep[3, n_dep])}#A",
-                "Début T": get_time_string(t_dep[3, n_dep]),
-                "Durée T": Taches.T_DEP[1],
-                "Lieu T": "WPY_FOR",
-                "Roulement": noms_roulements[r],
-            }
-            for n_dep in liste_id_train_depart
-            for r in equip[("dep", 1)]
-            for k in range(1, nb_cycles_agents[r] + 1)
-            if 15 * t_dep[1, n_dep] >= h_deb[r, k]
-            and 15 * t_dep[1, n_dep] + Taches.T_DEP[1] <= h_deb[r, k] + 8 * 60
-            if who_dep[(1, n_dep, r, k, 3 * t_dep[1, n_dep])].X == 1
-        ]
-        + [
-            {
-                "Id JS": noms_roulements[r]
-                + "_"
-                + str((h_deb[(r, k)] % 1440) // 60)
-                + "_"
-                + get_time_string(t_dep[2, n_dep]),
-                "Ordre T": 2,
-                "Type T": noms_tache[5],
-                "Sillon": f"{n_dep}#{get_time_string(t_dep[2, n_dep])}#A",
-                "Début T": get_time_string(t_dep[2, n_dep]),
-                "Durée T": Taches.T_DEP[2],
-                "Lieu T": "WPY_FOR",
-                "Roulement": noms_roulements[r],
-            }
-            for n_dep in liste_id_train_depart
-            for r in equip[("dep", 2)]
-            for k in range(1, nb_cycles_agents[r] + 1)
-            if 15 * t_dep[2, n_dep] >= h_deb[r, k]
-            and 15 * t_dep[2, n_dep] + Taches.T_DEP[2] <= h_deb[r, k] + 8 * 60
-            if who_dep[(2, n_dep, r, k, 3 * t_dep[2, n_dep])].X == 1
-        ]
-        + [
-            {
-                "Id JS": noms_roulements[r]
-                + "_"
-                + str((h_deb[(r, k)] % 1440) // 60)
-                + "_"
-                + get_time_string(t_dep[3, n_dep]),
-                "Ordre T": 3,
-                "Type T": noms_tache[6],
-                "Sillon": f"{n_dep}#{get_time_string(t_dep[3, n_dep])}#A",
-                "Début T": get_time_string(t_dep[3, n_dep]),
-                "Durée T": Taches.T_DEP[3],
-                "Lieu T": "WPY_FOR",
-                "Roulement": noms_roulements[r],
-            }
-            for n_dep in liste_id_train_depart
-            for r in equip[("dep", 3)]
-            for k in range(1, nb_cycles_agents[r] + 1)
-            if 15 * t_dep[3, n_dep] >= h_deb[r, k]
-            and 15 * t_dep[3, n_dep] + Taches.T_DEP[3] <= h_deb[r, k] + 8 * 60
-            if who_dep[(3, n_dep, r, k, 3 * t_dep[3, n_dep])].X == 1
-        ]
-        + [
-            {
-                "Id JS": noms_roulements[r]
-                + "_"
-                + str((h_deb[(r, k)] % 1440) // 60)
-                + "_"
-                + get_time_string(t_dep[4, n_dep]),
-                "Ordre T": 4,
-                "Type T": noms_tache[7],
-                "Sillon": f"{n_dep}#{get_time_string(t_dep[4, n_dep])}#A",
-                "Début T": get_time_string(t_dep[4, n_dep]),
-                "Durée T": Taches.T_DEP[4],
-                "Lieu T": "WPY_DEP",
-                "Roulement": noms_roulements[r],
-            }
-            for n_dep in liste_id_train_depart
-            for r in equip[("dep", 4)]
-            for k in range(1, nb_cycles_agents[r] + 1)
-            if 15 * t_dep[4, n_dep] >= h_deb[r, k]
-            and 15 * t_dep[4, n_dep] + Taches.T_DEP[4] <= h_deb[r, k] + 8 * 60
-            if who_dep[(4, n_dep, r, k, 3 * t_dep[4, n_dep])].X == 1
-        ]
+    textes = _formater_debuts(
+        np.fromiter(chain(quarts_arr.values(), quarts_dep.values()), np.int64),
+        monday,
+        "%d/%m/%Y %H:%M",
     )
+    debuts_arr = {cle: textes[v] for cle, v in quarts_arr.items()}
+    debuts_dep = {cle: textes[v] for cle, v in quarts_dep.items()}
+    heures_cycles = {cle: str((h % 1440) // 60) for cle, h in h_deb.items()}
+
+    def ligne_agent(
+        r: int,
+        k: int,
+        n: str,
+        ordre: int,
+        type_tache: str,
+        debut: str,
+        duree: int,
+        lieu: str,
+    ) -> tuple:
+        """Construit la ligne de sortie d'une tâche réalisée par un roulement."""
+        return (
+            noms_roulements[r] + "_" + heures_cycles[r, k] + "_" + debut,
+            ordre,
+            type_tache,
+            f"{n}#{debut}#A",
+            debut,
+            duree,
+            lieu,
+            noms_roulements[r],
+        )
 
-    df_xl = pd.DataFrame(xl)
-
-    xl2 = {"Nb de JS activées": [noms_roulements[r] for r in noms_roulements.keys()]}
+    lieux_dep = {1: "WPY_FOR", 2: "WPY_FOR", 3: "WPY_FOR", 4: "WPY_DEP"}
+
+    # Début de chaque tâche en minutes et en créneaux de 5 minutes
+    minutes_arr = {cle: 15 * v for cle, v in t_arr.items()}
+    minutes_dep = {cle: 15 * v for cle, v in t_dep.items()}
+    creneaux_arr = {cle: 3 * v for cle, v in t_arr.items()}
+    creneaux_dep = {cle: 3 * v for cle, v in t_dep.items()}
+
+    # Parcours unique des affectations : seule la variable du créneau de
+    # début de la tâche (t = 3 * t_arr) est lue
+    xl = []
+    for (m, n_arr, r, k, t), var in who_arr.items():
+        if t != creneaux_arr[m, n_arr]:
+            continue
+        if not (
+            minutes_arr[m, n_arr] >= h_deb[r, k]
+            and minutes_arr[m, n_arr] + Taches.T_ARR[m] <= h_deb[r, k] + 8 * 60
+        ):
+            continue
+        if var.X == 1:
+            xl.append(
+                ligne_agent(
+                    r,
+                    k,
+                    n_arr,
+                    m,
+                    noms_tache[m],
+                    debuts_arr[m, n_arr],
+                    Taches.T_ARR[m],
+                    "WPY_REC",
+                )
+            )
+    for (m, n_dep, r, k, t), var in who_dep.items():
+        if t != creneaux_dep[m, n_dep]:
+            continue
+        if not (
+            minutes_dep[m, n_dep] >= h_deb[r, k]
+            and minutes_dep[m, n_dep] + Taches.T_DEP[m] <= h_deb[r, k] + 8 * 60
+        ):
+            continue
+        if var.X == 1:
+            xl.append(
+                ligne_agent(
+                    r,
+                    k,
+                    n_dep,
+                    m,
+                    noms_tache[3 + m],
+                    debuts_dep[m, n_dep],
+                    Taches.T_DEP[m],
+                    lieux_dep[m],
+                )
+            )
 
     nb_jour = nombre_cycles_agents[1] // nb_cycle_jour[1]
 
-    for j in range(nb_jour):
-        xl2[(monday + timedelta(days=j)).strftime(format="%d/%m/%Y")] = [
-            0 for r in noms_roulements.keys()
-        ]
+    # Libellés des jours formatés une seule fois
+    jours = [
+        (monday + timedelta(days=j)).strftime(format="%d/%m/%Y") for j in range(nb_jour)
+    ]
+
+    # Agents activés par roulement (lignes) et par jour (colonnes)
+    activations = np.zeros((len(noms_roulements), nb_jour))
     for r in noms_roulements.keys():
         for k in range(1, nombre_cycles_agents[r] + 1):
-            xl2[(monday + timedelta(minutes=h_deb[r, k])).strftime(format="%d/%m/%Y")][
-                r - 1
-            ] += nombre_agents[r, k].X
-
-    xl2["Total"] = [
-        sum(
-            [
-                xl2[(monday + timedelta(days=j)).strftime(format="%d/%m/%Y")][r - 1]
-                for j in range(nb_jour)
-            ]
-        )
-        for r in noms_roulements.keys()
-    ]
+            activations[r - 1, h_deb[r, k] // 1440] += nombre_agents[r, k].X
 
-    df_xl2 = pd.DataFrame(xl2)
+    df_xl2 = pd.DataFrame(activations, columns=jours)
+    df_xl2.insert(0, "Nb de JS activées", list(noms_roulements.values()))
+    df_xl2["Total"] = activations.sum(axis=1)
 
-    return df_xl, df_xl2
+    return xl, df_xl2
@@ -9,20 +9,38 @@ Fonctions :
 - convert_hour_to_minutes(hour_str: str) -> int | None:
     Convertit une chaîne représentant une heure au format "hh:mm" en
     minutes.
-    
+
+- convertir_heures_en_minutes(heures: pd.Series) -> pd.Series:
+    Version vectorisée de convert_hour_to_minutes pour une série entière.
+
 - convertir_en_minutes(indisponibilites: str, df_sillon_dep: pd.DataFrame,
-                       dernier_depart: float) -> list:
+                       dernier_depart: float) -> np.ndarray:
     Convertit les plages d'indisponibilités en minutes et les étend chaque
     semaine jusqu'à dépasser l'heure du dernier train.
 
+- convertir_en_minutes_batch(liste_indisponibilites: list,
+                             dernier_depart: float) -> list:
+    Convertit une liste de chaînes d'indisponibilités en tableaux numpy
+    plats de bornes en minutes.
+
 - traitement_doublons(liste: list) -> list:
     Supprime les éléments consécutifs identiques dans chaque sous-liste
     d'une liste donnée.
 """
 
 import re
+from functools import lru_cache
+from math import floor
+
+import numpy as np
 import pandas as pd
 
+# Plage d'indisponibilité "(jour, hh:mm-hh:mm)"
+_MOTIF_PLAGE = re.compile(r"\((\d+),\s*(\d{1,2}):(\d{2})-(\d{1,2}):(\d{2})\)")
+
+# Heure "hh:mm", avec les tolérances de int() (signe, espaces)
+_MOTIF_HEURE = re.compile(r"^\s*([+-]?\d+)\s*:\s*([+-]?\d+)\s*$")
+
 
 def convert_hour_to_minutes(hour_str: str) -> int | None:
     """
@@ -47,12 +65,55 @@ def convert_hour_to_minutes(hour_str: str) -> int | None:
         return None  # Si le format est incorrect
 
 
+def convertir_heures_en_minutes(heures: pd.Series) -> pd.Series:
+    """
+    Convertit une série d'heures au format "hh:mm" en nombre total de minutes.
+
+    Version vectorisée de convert_hour_to_minutes. Les valeurs "hh:mm" sur
+    cinq caractères (cas courant) sont converties par arithmétique sur les
+    codes des chiffres ; seules les autres passent par l'expression régulière.
+
+    Paramètres :
+    ------------
+    heures : pd.Series
+        Série de chaînes représentant des heures au format "hh:mm".
+
+    Retourne :
+    ----------
+    pd.Series
+        Minutes depuis minuit (float), NaN là où convert_hour_to_minutes
+        renverrait None.
+    """
+    minutes = np.full(len(heures), np.nan)
+    a_traiter = np.ones(len(heures), dtype=bool)
+
+    # Chemin rapide : "hh:mm" exact, lu comme une matrice de codes Unicode
+    cinq = heures.str.len().eq(5).fillna(False).to_numpy(dtype=bool)
+    if cinq.any():
+        codes = (
+            heures[cinq].to_numpy().astype("U5").view(np.uint32).reshape(-1, 5)
+        ).astype(np.int64) - ord("0")
+        chiffres = codes[:, [0, 1, 3, 4]]
+        propres = (codes[:, 2] == ord(":") - ord("0")) & (
+            (chiffres >= 0) & (chiffres <= 9)
+        ).all(axis=1)
+        lignes = np.flatnonzero(cinq)[propres]
+        minutes[lignes] = chiffres[propres] @ np.array([600, 60, 10, 1])
+        a_traiter[lignes] = False
+
+    if a_traiter.any():
+        champs = heures[a_traiter].str.extract(_MOTIF_HEURE).astype(float)
+        minutes[a_traiter] = (champs[0] * 60 + champs[1]).to_numpy()
+
+    return pd.Series(minutes, index=heures.index)
+
+
 def convertir_en_minutes(
     indisponibilites: str,
     dernier_depart: float,
-) -> list:
+) -> np.ndarray:
     """
-    Convertit les plages d'indisponibilités en minutes et les prolonge 
+    Convertit les plages d'indisponibilités en minutes et les prolonge
     chaque semaine jusqu'à dépasser l'heure du dernier train.
 
     Paramètres :
@@ -64,77 +125,112 @@ def convertir_en_minutes(
 
     Retourne :
     ----------
-    list
-        Liste de tuples représentant les plages d'indisponibilités en minutes, 
+    np.ndarray
+        Tableau (n, 2) des plages d'indisponibilités (début, fin) en minutes,
         répétées chaque semaine jusqu'à l'heure du dernier départ.
     """
-    pattern = r"\((\d+),\s*(\d{1,2}):(\d{2})-(\d{1,2}):(\d{2})\)"
-    plages_originales = []
-
-    for match in re.finditer(pattern, indisponibilites):
-        jour = int(match.group(1))
-        debut_h, debut_m = int(match.group(2)), int(match.group(3))
-        fin_h, fin_m = int(match.group(4)), int(match.group(5))
-
-        debut_minutes = (jour - 1) * 1440 + debut_h * 60 + debut_m
-        fin_minutes = (jour - 1) * 1440 + fin_h * 60 + fin_m
-
-        plages_originales.append((debut_minutes, fin_minutes))
-
-    # Si aucune plage trouvée, retourner une liste vide
-    if not plages_originales:
-        return []
+    plages = _MOTIF_PLAGE.findall(indisponibilites)
+
+    # Si aucune plage trouvée, retourner un tableau vide
+    if not plages:
+        return np.empty((0, 2), dtype=np.int64)
+
+    # Colonnes : jour, heure et minute de début, heure et minute de fin
+    champs = np.array(plages, dtype=np.int64)
+    decalage_jour = (champs[:, 0] - 1) * 1440
+    plages_originales = np.column_stack(
+        (
+            decalage_jour + champs[:, 1] * 60 + champs[:, 2],
+            decalage_jour + champs[:, 3] * 60 + champs[:, 4],
+        )
+    )
+
+    # Étendre les indisponibilités chaque semaine (10080 minutes) jusqu'à ce
+    # que la fin de la dernière plage dépasse l'heure du dernier train
+    nb_semaines = (
+        max(0, floor((dernier_depart - plages_originales[-1, 1]) / 10080) + 1) + 1
+    )
+    decalages = np.arange(nb_semaines, dtype=np.int64)[:, None, None] * 10080
+    return (plages_originales[None, :, :] + decalages).reshape(-1, 2)
+
+
+def convertir_en_minutes_batch(
+    liste_indisponibilites: list,
+    dernier_depart: float,
+) -> list:
+    """
+    Convertit en une passe plusieurs chaînes d'indisponibilités en listes
+    plates de bornes en minutes.
 
-    # Étendre les indisponibilités chaque semaine jusqu'à dépasser l'heure du dernier train
-    plages_etendues = []
-    semaine = 0
-    while True:
-        semaine_offset = semaine * 10080  # 7 jours en minutes
-        nouvelles_plages = [
-            (deb + semaine_offset, fin + semaine_offset)
-            for deb, fin in plages_originales
-        ]
+    Paramètres :
+    ------------
+    liste_indisponibilites : list
+        Chaînes d'indisponibilités au format "(jour, hh:mm-hh:mm)".
+    dernier_depart : float
+        Heure du dernier départ en minutes.
 
-        # Vérifier si on a de nouvelles plages avant d'ajouter
-        if not nouvelles_plages:
-            break  # Évite l'accès à une liste vide
+    Retourne :
+    ----------
+    list
+        Pour chaque chaîne, le tableau plat [début, fin, début, fin, ...] des
+        plages d'indisponibilités étendues jusqu'au dernier départ (en lecture
+        seule, partagé par le cache).
+    """
+    return [
+        _bornes_en_minutes(indisponibilites, dernier_depart)
+        for indisponibilites in liste_indisponibilites
+    ]
 
-        # Ajouter les nouvelles plages
-        plages_etendues.extend(nouvelles_plages)
 
-        # Vérifier si la dernière plage dépasse l'heure du dernier train
-        if nouvelles_plages[-1][1] > dernier_depart:
-            break
+@lru_cache(maxsize=1024)
+def _bornes_en_minutes(indisponibilites: str, dernier_depart: float) -> np.ndarray:
+    """
+    Version mémoïsée et aplatie de convertir_en_minutes : une même chaîne
+    d'indisponibilités (fréquente entre chantiers et machines) n'est analysée
+    qu'une fois pour un dernier départ donné.
 
-        semaine += 1  # Passer à la semaine suivante
+    Paramètres :
+    ------------
+    indisponibilites : str
+        Chaîne au format "(jour, hh:mm-hh:mm)".
+    dernier_depart : float
+        Heure du dernier départ en minutes.
 
-    return plages_etendues
+    Retourne :
+    ----------
+    np.ndarray
+        Tableau plat des bornes en minutes, non modifiable.
+    """
+    bornes = convertir_en_minutes(indisponibilites, dernier_depart).ravel()
+    bornes.flags.writeable = False
+    return bornes
 
 
 def traitement_doublons(liste: list) -> list:
     """
-    Supprime les éléments consécutifs identiques dans chaque sous-liste 
+    Supprime les éléments consécutifs identiques dans chaque sous-liste
     d'une liste donnée.
 
     Paramètres :
     ------------
     liste : list
-        Liste contenant des sous-listes d'éléments.
+        Liste contenant des sous-listes (ou tableaux numpy) d'éléments.
 
     Retourne :
     ----------
     list
-        Nouvelle liste où les éléments
+        Nouvelle liste où les éléments consécutifs égaux sont retirés deux
+        à deux : dans une suite de n valeurs égales, il n'en reste qu'une
+        si n est impair, aucune sinon.
     """
     resultat = []
     for elmt in liste:
-        resultat_int = []
-        i = 0
-        while i < len(elmt):
-            if i < len(elmt) - 1 and elmt[i] == elmt[i + 1]:
-                i += 2  # On saute les deux éléments consécutifs égaux
-            else:
-                resultat_int.append(elmt[i])
-                i += 1  # On avance normalement si pas de doublon
-        resultat.append(resultat_int)
+        elmt = np.asarray(elmt)
+        if elmt.size == 0:
+            resultat.append([])
+            continue
+        # Découpage en suites de valeurs égales consécutives
+        debuts = np.flatnonzero(np.r_[True, elmt[1:] != elmt[:-1]])
+        longueurs = np.diff(np.r_[debuts, elmt.size])
+        resultat.append(elmt[debuts[longueurs % 2 == 1]].tolist())
     return resultat
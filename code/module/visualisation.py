@@ -3,23 +3,96 @@ Module de visualisation de solutions d'attribution des créneaux des tâches.
 
 Fonctions :
 -----------
+valeurs_variables : Récupère en bloc les valeurs d'un dictionnaire de variables.
+occupation_chantiers : Compte les trains présents sur chaque chantier à chaque instant.
 visualisation_gantt : Prépare la visualisation du diagramme de Gantt des tâches.
+indices_lttb : Sous-échantillonne une série pour le tracé (LTTB).
 visualisation_occupation : Prépare la visualisation de l'occupation des voies de chantier.
 """
 
-import itertools
-from datetime import timedelta, datetime
+from datetime import datetime
 
-import matplotlib.dates as mdates
-import matplotlib.pyplot as plt
+import numpy as np
 import pandas as pd
 import plotly.express as px
-from plotly.graph_objects import Figure
+from plotly.graph_objects import Figure, Scattergl
 
 from module.constants import Taches
 
+# Nombre maximal de points tracés par courbe d'occupation (une semaine au
+# quart d'heure en compte 672)
+POINTS_MAX_TRACE = 500
 
-def visualisation_gantt(t_arr: dict, t_dep: dict, monday: datetime) -> Figure:
+# Ordre d'affichage des machines dans le diagramme de Gantt
+MACHINES_ORDONNEES = ("arr_1", "arr_2", "arr_3", "dep_1", "dep_2", "dep_3", "dep_4")
+
+
+def valeurs_variables(variables: dict, model=None) -> np.ndarray:
+    """
+    Récupère la valeur dans la solution de chaque variable d'un dictionnaire.
+
+    Paramètres :
+    -----------
+    variables : dict
+        Variables Gurobi, dans l'ordre du dictionnaire.
+    model : grb.Model, optionnel
+        Modèle résolu. S'il est fourni, toutes les valeurs sont lues en un seul
+        appel à getAttr au lieu d'un accès à .X par variable.
+
+    Retourne :
+    ---------
+    np.ndarray
+        Valeurs des variables, dans l'ordre du dictionnaire.
+    """
+    if model is not None:
+        return np.asarray(model.getAttr("X", list(variables.values())), dtype=float)
+    return np.fromiter(
+        (var.X for var in variables.values()), dtype=float, count=len(variables)
+    )
+
+
+def occupation_chantiers(is_present: dict, model=None) -> tuple[np.ndarray, dict]:
+    """
+    Compte le nombre de trains présents sur chaque chantier à chaque instant.
+
+    Paramètres :
+    -----------
+    is_present : dict
+        Variables de présence des trains, indexées par chantier puis par
+        (train, instant).
+    model : grb.Model, optionnel
+        Modèle résolu, pour lire toutes les valeurs en un seul appel.
+
+    Retourne :
+    ---------
+    tuple[np.ndarray, dict]
+        Instants considérés, et occupation des voies de chaque chantier
+        à ces instants.
+    """
+    instants = {
+        chantier: np.fromiter(
+            (t for _, t in variables), dtype=np.int64, count=len(variables)
+        )
+        for chantier, variables in is_present.items()
+    }
+    t_min = min(int(t.min()) for t in instants.values())
+    t_max = max(int(t.max()) for t in instants.values())
+
+    # Somme des présences par instant, en une passe sur les variables
+    occupation = {
+        chantier: np.bincount(
+            instants[chantier] - t_min,
+            weights=valeurs_variables(variables, model),
+            minlength=t_max - t_min + 1,
+        )
+        for chantier, variables in is_present.items()
+    }
+    return np.arange(t_min, t_max + 1), occupation
+
+
+def visualisation_gantt(
+    t_arr: dict, t_dep: dict, monday: datetime, model=None
+) -> Figure:
     """
     Prépare la visualisation du diagramme de Gantt des tâches.
 
@@ -29,52 +102,59 @@ def visualisation_gantt(t_arr: dict, t_dep: dict, monday: datetime) -> Figure:
         Variables de début des tâches d'arrivée.
     t_dep : dict
         Variables de début des tâches de départ.
+    monday : datetime
+        Date du lundi de référence.
+    model : grb.Model, optionnel
+        Modèle résolu, pour lire toutes les valeurs en un seul appel.
 
     Retourne :
     ---------
     fig
         Trace le diagramme de Gantt.
     """
-    # Liste ordonnée des machines
-    ordered_machines = ["arr_1", "arr_2", "arr_3", "dep_1", "dep_2", "dep_3", "dep_4"]
+    # Valeurs de la solution, lues une seule fois par variable
+    valeurs = np.concatenate(
+        [valeurs_variables(t_arr, model), valeurs_variables(t_dep, model)]
+    )
 
-    # Données fournies sous forme de liste de dictionnaires
-    tasks = [
-        {
-            "Train": n_arr,
-            "Start": monday + timedelta(minutes=15 * var_arr.X),
-            "Finish": monday
-            + timedelta(minutes=15 * var_arr.X + Taches.T_ARR[m_arr]),
-            "Machine": f"arr_{m_arr}",
-            "Tâches": f"arr_{m_arr}",
-        }
-        for (m_arr, n_arr), var_arr in t_arr.items()
-    ] + [
-        {
-            "Train": n_dep,
-            "Start": monday + timedelta(minutes=15 * var_dep.X),
-            "Finish": monday
-            + timedelta(minutes=15 * var_dep.X + Taches.T_DEP[m_dep]),
-            "Machine": f"dep_{m_dep}",
-            "Tâches": f"dep_{m_dep}",
-        }
-        for (m_dep, n_dep), var_dep in t_dep.items()
+    # Tâches d'arrivée puis de départ, parcourues en une seule passe
+    sens_taches = (("arr", t_arr, Taches.DUREES_ARR), ("dep", t_dep, Taches.DUREES_DEP))
+    taches = [
+        (f"{sens}_{m}", n) for sens, variables, _ in sens_taches for m, n in variables
     ]
+    machines = [machine for machine, _ in taches]
 
-    # Construction du DataFrame pour la visualisation
-    gantt_df = pd.DataFrame(tasks)
+    # Durées lues dans les tableaux indexés par numéro de tâche
+    durees = np.concatenate(
+        [
+            durees_sens[
+                np.fromiter(
+                    (m for m, _ in variables), dtype=np.intp, count=len(variables)
+                )
+            ]
+            for _, variables, durees_sens in sens_taches
+        ]
+    )
 
-    # Regroupement des ressources par machine
-    resource_per_machine = {}
-    for task in tasks:
-        resource_per_machine.setdefault(task["Machine"], set()).add(task["Tâches"])
+    # Dates de début et de fin calculées en bloc
+    debuts = pd.Timestamp(monday) + pd.to_timedelta(15 * valeurs, unit="m")
+    fins = debuts + pd.to_timedelta(durees, unit="m")
 
-    sorted_resources = list(
-        itertools.chain.from_iterable(
-            [sorted(resource_per_machine[machine]) for machine in ordered_machines]
-        )
+    # Construction du DataFrame pour la visualisation, colonne par colonne
+    gantt_df = pd.DataFrame(
+        {
+            "Train": [n for _, n in taches],
+            "Start": debuts,
+            "Finish": fins,
+            "Machine": machines,
+            "Tâches": machines,
+        }
     )
 
+    # Machines utilisées, dans l'ordre d'affichage (une tâche par machine)
+    machines_utilisees = set(machines)
+    sorted_resources = [m for m in MACHINES_ORDONNEES if m in machines_utilisees]
+
     fig = px.timeline(
         gantt_df, x_start="Start", x_end="Finish", y="Tâches", color="Train"
     )
@@ -83,12 +163,62 @@ def visualisation_gantt(t_arr: dict, t_dep: dict, monday: datetime) -> Figure:
     return fig
 
 
+def indices_lttb(y: np.ndarray, n_sortie: int) -> np.ndarray:
+    """
+    Sélectionne les points à tracer d'une série régulièrement échantillonnée
+    par l'algorithme LTTB (Largest-Triangle-Three-Buckets).
+
+    Le premier et le dernier point sont conservés ; les autres sont répartis
+    en n_sortie - 2 seaux, dans chacun desquels on garde le point formant le
+    plus grand triangle avec le point retenu précédemment et la moyenne du
+    seau suivant. La forme de la courbe (pics compris) est ainsi préservée.
+
+    Paramètres :
+    -----------
+    y : np.ndarray
+        Valeurs de la série.
+    n_sortie : int
+        Nombre de points à conserver.
+
+    Retourne :
+    ---------
+    np.ndarray
+        Indices croissants des points conservés (tous si la série est courte).
+    """
+    n = len(y)
+    if n <= n_sortie or n_sortie < 3:
+        return np.arange(n)
+
+    bornes = np.linspace(1, n - 1, n_sortie - 1).astype(np.int64)
+    indices = np.empty(n_sortie, dtype=np.int64)
+    indices[0], indices[-1] = 0, n - 1
+
+    a = 0
+    for i in range(n_sortie - 2):
+        debut, fin = bornes[i], bornes[i + 1]
+        fin_suivant = bornes[i + 2] if i + 2 < len(bornes) else n
+        x_moyen = (fin + fin_suivant - 1) / 2
+        y_moyen = y[fin:fin_suivant].mean()
+
+        x = np.arange(debut, fin)
+        aires = np.abs(
+            (a - x_moyen) * (y[debut:fin] - y[a]) - (a - x) * (y_moyen - y[a])
+        )
+        a = debut + int(np.argmax(aires))
+        indices[i + 1] = a
+
+    return indices
+
+
 def visualisation_occupation(
     occupation_REC: list, occupation_FOR: list, occupation_DEP: list, x_date: list
-) -> bool:
+) -> Figure:
     """
     Prépare la visualisation de l'occupation des voies de chaque chantier en fonction du temps.
 
+    Les courbes sont tracées en Scattergl (rendu WebGL), ce qui garde le zoom
+    et le déplacement fluides même sur de longues séries.
+
     Paramètres :
     -----------
     occupation_REC : list
@@ -102,58 +232,49 @@ def visualisation_occupation(
 
     Retourne :
     ---------
-    bool
-        True si le graphique est construit.
+    Figure
+        Graphique plotly de l'occupation des voies.
     """
-    # Calcul des valeurs maximales
-    max_REC = max(occupation_REC)
-    max_FOR = max(occupation_FOR)
-    max_DEP = max(occupation_DEP)
-
-    # Tracé des courbes
-    plt.figure(figsize=(10, 5))
-    plt.plot(x_date, occupation_REC, label="REC", color="#a1006b")
-    plt.plot(x_date, occupation_FOR, label="FOR", color="#009aa6")
-    plt.plot(x_date, occupation_DEP, label="DEP", color="#d2e100")
-
-    # Ajout des lignes horizontales aux valeurs max
-    plt.axhline(
-        y=max_REC,
-        color="#a1006b",
-        linestyle="--",
-        linewidth=2,
-        label=f"Max REC ({int(max_REC)})",
-    )
-    plt.axhline(
-        y=max_FOR,
-        color="#009aa6",
-        linestyle="--",
-        linewidth=2,
-        label=f"Max FOR ({int(max_FOR)})",
-    )
-    plt.axhline(
-        y=max_DEP,
-        color="#d2e100",
-        linestyle="--",
-        linewidth=2,
-        label=f"Max DEP ({int(max_DEP)})",
-    )
+    fig = Figure()
+    x_date = np.asarray(x_date, dtype=object)
 
-    # Étiquettes et légende
-    plt.xlabel("Date")
-    plt.ylabel("Nombre de voies occupées")
-    plt.legend()
-    plt.grid(True)
+    for occupation, label, color in (
+        (occupation_REC, "REC", "#a1006b"),
+        (occupation_FOR, "FOR", "#009aa6"),
+        (occupation_DEP, "DEP", "#d2e100"),
+    ):
+        occupation = np.asarray(occupation, dtype=float)
+        # Valeur maximale calculée sur la série complète
+        max_occupation = occupation.max()
 
-    # Appliquer le format de date "jj/mm/aaaa"
-    plt.gca().xaxis.set_major_formatter(mdates.DateFormatter("%d/%m/%Y"))
+        # Tracé de la courbe, sous-échantillonnée au-delà de POINTS_MAX_TRACE points
+        indices = indices_lttb(occupation, POINTS_MAX_TRACE)
+        fig.add_trace(
+            Scattergl(
+                x=x_date[indices],
+                y=occupation[indices],
+                mode="lines",
+                name=label,
+                line={"color": color},
+            )
+        )
 
-    # Espacer les ticks de l'axe X (ajustable selon le nombre de points)
-    plt.gca().xaxis.set_major_locator(
-        mdates.DayLocator(interval=1)
-    )  # Affiche une date par jour
+        # Ajout de la ligne horizontale à la valeur max
+        fig.add_hline(
+            y=max_occupation,
+            line_color=color,
+            line_dash="dash",
+            line_width=2,
+            annotation_text=f"Max {label} ({int(max_occupation)})",
+        )
 
-    # Optionnel : masquer les ticks de l'axe x si on ne remplace pas par les dates
-    plt.xticks(rotation=45)
+    # Étiquettes, format de date "jj/mm/aaaa" et une date par jour
+    fig.update_layout(
+        xaxis_title="Date",
+        yaxis_title="Nombre de voies occupées",
+        width=1000,
+        height=500,
+    )
+    fig.update_xaxes(tickformat="%d/%m/%Y", dtick=24 * 60 * 60 * 1000, tickangle=45)
 
-    return True
+    return fig